@@ -11,6 +11,7 @@ const os = require('os');
 const fs = require('fs');
 
 const Window = require('./window');
+const { MessageReader, encodeMessage, parseMessage } = require('./protocol');
 
 const fixPath = require('fix-path');
 fixPath();
@@ -42,57 +43,73 @@ app.on('window-all-closed', () => {
 
 const server = net.createServer();
 
+// Sockets that asked to be told about viewport changes, with their readers.
+const shapeListeners = new Map();
+let viewportShape = null;
+
+function encodeShape(reader) {
+    return encodeMessage({ event: 'shape', ...viewportShape }, reader.framed);
+}
+
+ipcMain.on('viewport-shape', (event, shape) => {
+    viewportShape = shape;
+
+    for (const [socket, reader] of shapeListeners) {
+        socket.write(encodeShape(reader));
+    }
+
+    event.returnValue = '';
+});
+
 server.on('connection', socket => {
     ipcMain.on('send-results', (event, data) => {
-        socket.write(JSON.stringify(data));
+        socket.write(encodeMessage(data, reader.framed));
 
         event.returnValue = '';
     });
 
-    let accumulated = '';
+    const reader = new MessageReader(message => {
+        try {
+            const parsedMessage = parseMessage(message);
 
-    socket.on('data', data => {
-        data = data.toString().split('\n');
+            if (parsedMessage.command === 'handshake') {
+                const { protocol, events = [] } = parsedMessage.args;
 
-        let last = data.pop();
-        if (last !== '') {
-            accumulated += last;
-        } else if (accumulated) {
-            data[0] = accumulated + data[0];
-            accumulated = '';
-        }
-
-        data.forEach(message => {
-            try {
-                message = message.replaceAll('-Infinity', 'Infinity');
-                message = message.replaceAll('Infinity', '"Infinity"');
-
-                let parsedMessage = JSON.parse(message);
+                reader.framed = protocol === 'framed';
 
-                if (parsedMessage.command === 'resizeWindow') {
-                    const { width, height } = parsedMessage.args;
+                if (events.includes('shape')) {
+                    shapeListeners.set(socket, reader);
 
-                    const currentBounds = mainWindow.window.getBounds();
-                    if (currentBounds.width === width && currentBounds.height === height) {
-                        socket.write('[]');
-                    } else {
-                        mainWindow.dispatchWebEvent('resize-window');
-
-                        mainWindow.window.setBounds({
-                            width: width,
-                            height: height
-                        });
+                    if (viewportShape !== null) {
+                        socket.write(encodeShape(reader));
                     }
+                }
+            } else if (parsedMessage.command === 'resizeWindow') {
+                const { width, height } = parsedMessage.args;
+
+                const currentBounds = mainWindow.window.getBounds();
+                if (currentBounds.width === width && currentBounds.height === height) {
+                    socket.write(encodeMessage([], reader.framed));
                 } else {
-                    mainWindow.dispatchWebEvent('parse-message', parsedMessage);
+                    mainWindow.dispatchWebEvent('resize-window');
+
+                    mainWindow.window.setBounds({
+                        width: width,
+                        height: height
+                    });
                 }
-            } catch(e) {
-                console.log(e, message);
+            } else {
+                mainWindow.dispatchWebEvent('parse-message', parsedMessage);
             }
-        });
+        } catch(e) {
+            console.log(e, message.toString());
+        }
     });
 
+    socket.on('data', data => reader.push(data));
+
     socket.on('close', () => {
+        shapeListeners.delete(socket);
         ipcMain.removeAllListeners('send-results');
     });
 
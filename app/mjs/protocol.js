@@ -0,0 +1,166 @@
+const HEADER_SIZE = 4;
+const NEWLINE = 0x0a;
+
+const ARRAY_TYPES = {
+    float32: Float32Array,
+    float64: Float64Array
+};
+
+
+class MessageReader {
+    constructor(onMessage) {
+        this.onMessage = onMessage;
+
+        this.framed = false;
+
+        this.chunks = [];
+        this.length = 0;
+        this.scanned = 0;
+    }
+
+
+    push(chunk) {
+        this.chunks.push(chunk);
+        this.length += chunk.length;
+
+        // `framed` may be switched by `onMessage` (handshake), so the
+        // mode is checked again before every message.
+        while (this.length > 0) {
+            const message = this.framed ? this.readFrame() : this.readLine();
+
+            if (message === null) break;
+
+            if (message.length > 0) {
+                this.onMessage(message);
+            }
+        }
+    }
+
+
+    take(size) {
+        const buffer = this.chunks.length === 1
+              ? this.chunks[0]
+              : Buffer.concat(this.chunks, this.length);
+
+        const rest = buffer.subarray(size);
+
+        this.chunks = rest.length > 0 ? [rest] : [];
+        this.length = rest.length;
+
+        return buffer.subarray(0, size);
+    }
+
+
+    readLine() {
+        let offset = 0;
+
+        for (const chunk of this.chunks) {
+            const start = Math.max(this.scanned - offset, 0);
+
+            if (start < chunk.length) {
+                const index = chunk.indexOf(NEWLINE, start);
+
+                if (index !== -1) {
+                    const line = this.take(offset + index + 1);
+                    this.scanned = 0;
+
+                    return line.subarray(0, line.length - 1);
+                }
+            }
+
+            offset += chunk.length;
+        }
+
+        this.scanned = this.length;
+
+        return null;
+    }
+
+
+    readFrame() {
+        if (this.length < HEADER_SIZE) return null;
+
+        let head = this.chunks[0];
+        if (head.length < HEADER_SIZE) {
+            head = Buffer.concat(this.chunks, this.length);
+            this.chunks = [head];
+        }
+
+        const size = head.readUInt32BE(0);
+
+        if (this.length < HEADER_SIZE + size) return null;
+
+        return this.take(HEADER_SIZE + size).subarray(HEADER_SIZE);
+    }
+}
+
+
+function encodeMessage(data, framed) {
+    const payload = Buffer.from(JSON.stringify(data), 'utf8');
+
+    if (!framed) {
+        return Buffer.concat([payload, Buffer.from([NEWLINE])]);
+    }
+
+    const header = Buffer.alloc(HEADER_SIZE);
+    header.writeUInt32BE(payload.length, 0);
+
+    return Buffer.concat([header, payload]);
+}
+
+
+function unflatten(array, shape) {
+    if (shape.length <= 1) return array;
+
+    const [rows, ...rest] = shape;
+    const rowSize = rows > 0 ? array.length / rows : 0;
+
+    const nested = [];
+
+    for (let i = 0; i < rows; i++) {
+        nested.push(unflatten(array.subarray(i * rowSize, (i + 1) * rowSize), rest));
+    }
+
+    return nested;
+}
+
+
+function decodeArray(encoded) {
+    const { __ndarray__: data, dtype, shape } = encoded;
+
+    const ArrayType = ARRAY_TYPES[dtype];
+    const bytes = Buffer.from(data, 'base64');
+
+    // Copy into a fresh buffer, since the decoded bytes may not be
+    // aligned for the typed array.
+    const array = new ArrayType(bytes.length / ArrayType.BYTES_PER_ELEMENT);
+    new Uint8Array(array.buffer).set(bytes);
+
+    return unflatten(array, shape);
+}
+
+
+function reviveArray(key, value) {
+    if (value !== null && typeof value === 'object' && '__ndarray__' in value) {
+        return decodeArray(value);
+    }
+
+    return value;
+}
+
+
+function parseMessage(buffer) {
+    let message = buffer.toString('utf8');
+
+    message = message.replaceAll('-Infinity', 'Infinity');
+    message = message.replaceAll('Infinity', '"Infinity"');
+
+    if (message.includes('"__ndarray__"')) {
+        return JSON.parse(message, reviveArray);
+    }
+
+    return JSON.parse(message);
+}
+
+
+module.exports = { MessageReader, encodeMessage, parseMessage };
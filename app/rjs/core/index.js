@@ -1,10 +1,15 @@
-function awaitEvent(args) {
+function tagResult(result, id) {
+    return id === undefined ? result : { id, result };
+}
+
+
+function awaitEvent(args, id) {
     const { type, dataKeys } = args;
 
     function temporaryEventListener(e) {
         document.removeEventListener(type, temporaryEventListener);
 
-        ipcRenderer.sendSync('send-results', dataKeys.map(k => e[k]));
+        ipcRenderer.sendSync('send-results', tagResult(dataKeys.map(k => e[k]), id));
 
         Properties.awaitingEvent = false;
     }
@@ -15,10 +20,10 @@ function awaitEvent(args) {
 }
 
 
-function awaitProperties(args) {
+function awaitProperties(args, id) {
     const { keys } = args;
 
-    ipcRenderer.sendSync('send-results', keys.map(k => Properties[k]));
+    ipcRenderer.sendSync('send-results', tagResult(keys.map(k => Properties[k]), id));
 }
 
 
@@ -98,6 +103,7 @@ ipcRenderer.on('parse-message', (_, data) => {
         awaitEvent: awaitEvent,
         awaitProperties: awaitProperties,
         renderScene: args => { sequence = Sequence.runFromArgs(artist, backgroundArtist, args) },
+        appendFrames: args => sequence && sequence.appendFrames(args),
         toggleBackground: toggleBackground,
         setLightMode: setLightMode,
         setDarkMode: setDarkMode,
@@ -113,5 +119,8 @@ ipcRenderer.on('parse-message', (_, data) => {
         }
     };
 
-    functionAssociation[data.command](data.args);
+    functionAssociation[data.command](data.args, data.id);
 });
+
+
+reportViewportShape();
@@ -232,7 +232,8 @@ class Artist {
             text: (shape) => shape.markdown ? this.drawMarkdown(shape) : this.drawText(shape),
             latex: this.drawLatex,
             svg: this.drawSVG,
-            table: this.drawTable
+            table: this.drawTable,
+            grid: this.drawGrid
         };
 
         methodAssociation[shape.type].call(this, shape);
@@ -323,7 +324,7 @@ class Artist {
         let discontinuity = false;
 
         points.slice(1).forEach(point => {
-            if (point[0] === 'Infinity' || point[1] === 'Infinity') {
+            if (!Number.isFinite(point[0]) || !Number.isFinite(point[1])) {
                 if (!discontinuity) {
                     this.ctx.stroke();
                 }
@@ -352,6 +353,72 @@ class Artist {
         this.ctx.setLineDash([]);
     }
 
+    strokeGridLines(origin, pixelStep, offset, color, width, skipAxis) {
+        const { width: canvasWidth, height: canvasHeight } = this.canvas;
+
+        this.ctx.strokeStyle = color;
+        this.ctx.lineWidth = width;
+
+        this.ctx.beginPath();
+
+        for (const axis of [0, 1]) {
+            const step = Math.abs(pixelStep[axis]);
+
+            // Lines closer than a pixel would only fill the canvas.
+            if (!(step >= 1)) continue;
+
+            const extent = axis === 0 ? canvasWidth : canvasHeight;
+            const start = Math.ceil((-origin[axis]) / step - offset);
+            const end = Math.floor((extent - origin[axis]) / step - offset);
+
+            for (let k = start; k <= end; k++) {
+                if (skipAxis && k === 0) continue;
+
+                const position = origin[axis] + (k + offset) * step;
+
+                if (axis === 0) {
+                    this.ctx.moveTo(position, 0);
+                    this.ctx.lineTo(position, canvasHeight);
+                } else {
+                    this.ctx.moveTo(0, position);
+                    this.ctx.lineTo(canvasWidth, position);
+                }
+            }
+        }
+
+        this.ctx.stroke();
+    }
+
+    drawGrid(args) {
+        const {
+            origin, scale, step, showAxes, labels,
+            primaryColor, secondaryColor, axisColor,
+            primaryWidth, secondaryWidth, axisWidth
+        } = args;
+
+        const pixelStep = [step[0] * scale[0], step[1] * scale[1]];
+
+        this.ctx.lineCap = 'butt';
+        this.ctx.setLineDash([]);
+
+        this.strokeGridLines(origin, pixelStep, -1/2, secondaryColor, secondaryWidth, false);
+        this.strokeGridLines(origin, pixelStep, 0, primaryColor, primaryWidth, true);
+
+        this.ctx.strokeStyle = showAxes ? axisColor : primaryColor;
+        this.ctx.lineWidth = showAxes ? axisWidth : primaryWidth;
+
+        this.ctx.beginPath();
+        this.ctx.moveTo(0, origin[1]);
+        this.ctx.lineTo(this.canvas.width, origin[1]);
+        this.ctx.moveTo(origin[0], 0);
+        this.ctx.lineTo(origin[0], this.canvas.height);
+        this.ctx.stroke();
+
+        for (const label of labels) {
+            this.draw(label);
+        }
+    }
+
     drawBezier(args) {
         const { points, color, width } = args;
 
@@ -53,12 +53,54 @@ class Camera {
 }
 
 
+class FrameDecoder {
+    constructor() {
+        this.shapes = new Map();
+    }
+
+
+    decode(frame) {
+        if (Array.isArray(frame)) return frame;
+
+        if ('keyframe' in frame) {
+            this.shapes = new Map(Object.entries(frame.keyframe));
+        } else {
+            for (const name of frame.removed ?? []) {
+                this.shapes.delete(name);
+            }
+
+            for (const [name, changes] of Object.entries(frame.delta)) {
+                this.shapes.set(name, { ...this.shapes.get(name), ...changes });
+            }
+
+            for (const [name, keys] of Object.entries(frame.removedKeys ?? {})) {
+                const shape = { ...this.shapes.get(name) };
+
+                for (const key of keys) {
+                    delete shape[key];
+                }
+
+                this.shapes.set(name, shape);
+            }
+
+            // Shapes are drawn in the order of the full frame.
+            if (frame.order) {
+                this.shapes = new Map(frame.order.map(name => [name, this.shapes.get(name)]));
+            }
+        }
+
+        return Array.from(this.shapes.values());
+    }
+}
+
+
 class Sequence {
-    constructor(artist, backgroundArtist, frames, frameDuration, savePath, background, awaitsCompletion) {
+    constructor(artist, backgroundArtist, frames, frameDuration, savePath, background, awaitsCompletion, encoding, streaming) {
         this.artist = artist;
         this.backgroundArtist = backgroundArtist;
 
         this.frames = frames;
+        this.decoder = encoding === 'delta' ? new FrameDecoder() : null;
         this.frameDuration = frameDuration * 1000;
         this.savePath = savePath;
         this.background = background;
@@ -66,14 +108,20 @@ class Sequence {
 
         this.isPlaying = false;
 
+        // Streamed sequences receive the rest of their frames through
+        // `appendFrames`; playback waits whenever it catches up.
+        this.isComplete = !streaming;
+        this.isWaiting = false;
+        this.computedFrames = [];
+
         this.camera;
     }
 
 
     static runFromArgs(artist, backgroundArtist, args) {
-        const { frames, frameDuration, savePath, background, awaitsCompletion } = args;
+        const { frames, frameDuration, savePath, background, awaitsCompletion, encoding, streaming } = args;
 
-        const sequence = new Sequence(artist, backgroundArtist, frames, frameDuration, savePath, background, awaitsCompletion);
+        const sequence = new Sequence(artist, backgroundArtist, frames, frameDuration, savePath, background, awaitsCompletion, encoding, streaming);
 
         sequence.play();
 
@@ -81,10 +129,14 @@ class Sequence {
     }
 
 
-    computeFrames() {
+    computeFrames(encodedFrames) {
         let frames = [];
 
-        for (const frame of this.frames) {
+        for (let frame of encodedFrames) {
+            if (this.decoder !== null) {
+                frame = this.decoder.decode(frame);
+            }
+
             const bufferCanvas = document.createElement('canvas');
             const bufferArtist = new Artist(bufferCanvas);
 
@@ -102,8 +154,31 @@ class Sequence {
     }
 
 
+    appendFrames(args) {
+        const { frames, done } = args;
+
+        for (const frame of this.computeFrames(frames)) {
+            this.computedFrames.push(frame);
+        }
+
+        if (done) {
+            this.isComplete = true;
+        }
+
+        if (this.isWaiting && this.isPlaying) {
+            this.isWaiting = false;
+            this.renderFrame(this.computedFrames);
+        }
+    }
+
+
     renderFrame(frames) {
         if (frames.length === 0) {
+            if (!this.isComplete) {
+                this.isWaiting = true;
+                return;
+            }
+
             if (this.awaitsCompletion) {
                 ipcRenderer.sendSync('send-results', ['completed']);
                 this.awaitsCompletion = false;
@@ -147,9 +222,9 @@ class Sequence {
             this.backgroundArtist.draw(shape);
         }
 
-        const computedFrames = this.computeFrames();
+        this.computedFrames = this.computeFrames(this.frames);
 
-        this.renderFrame(computedFrames);
+        this.renderFrame(this.computedFrames);
     }
 
     stop() {
@@ -16,6 +16,14 @@ function compensateViewport(length) {
 }
 
 
+function reportViewportShape() {
+    ipcRenderer.sendSync('viewport-shape', {
+        width: Properties.width,
+        height: Properties.height
+    });
+}
+
+
 function resizeCanvas(_, rerender=true) {
     if (Properties.isZoom) {
         Properties.isZoom = false;
@@ -48,6 +56,8 @@ function resizeCanvas(_, rerender=true) {
         Properties.rerenderBackground = true;
     }
 
+    reportViewportShape();
+
     if (Properties.sendResizeResponse) {
         ipcRenderer.sendSync('send-results', []);
 
@@ -0,0 +1,26 @@
+import pytest
+
+from maxwell.benchmarks.offline import OfflineClient
+from maxwell.core.coordinates.cartesian.system import CartesianSystem
+from maxwell.core.scene import Scene
+from maxwell.shapes.shape import Shape
+
+
+@pytest.fixture
+def client():
+    return OfflineClient(shape=(1200, 800))
+
+
+@pytest.fixture
+def system(client):
+    system = CartesianSystem(client, (80., 80.), client.get_shape() / 2)
+
+    Scene.DEFAULT_CLIENT = client
+    Shape.DEFAULT_CLIENT = client
+    Shape.DEFAULT_SYSTEM = system
+
+    yield system
+
+    Scene.DEFAULT_CLIENT = None
+    Shape.DEFAULT_CLIENT = None
+    Shape.DEFAULT_SYSTEM = None
@@ -0,0 +1,47 @@
+"""Time to build and render polar and cartesian grids of similar
+density.
+
+Run with `python -m maxwell.benchmarks.grid_benchmark`.
+"""
+
+import time
+
+from maxwell.core.coordinates.cartesian.system import CartesianSystem, CartesianGridConfig
+from maxwell.core.coordinates.polar.system import PolarSystem, PolarGridConfig
+from maxwell.benchmarks.offline import OfflineClient
+
+
+STEPS = (1, 0.5, 0.25, 0.1)
+
+
+def benchmark(system, grid_config, repeat=3):
+    client = system.client
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        grid = system.get_grid(grid_config=grid_config)
+
+    elapsed = (time.perf_counter() - start) / repeat
+
+    return len(grid.shapes), client.bytes_sent // repeat, elapsed
+
+
+def main():
+    print(f'{"system":<10} {"step":>6} {"shapes":>7} {"bytes":>10} {"seconds":>9}')
+
+    for step in STEPS:
+        client = OfflineClient()
+        system = CartesianSystem(client, (80, 80), client.get_shape() / 2)
+        shapes, size, elapsed = benchmark(system, CartesianGridConfig(step_x=step, step_y=step))
+
+        print(f'{"cartesian":<10} {step:>6} {shapes:>7} {size:>10} {elapsed:>9.3f}')
+
+        client = OfflineClient()
+        system = PolarSystem(client, (80, 80), client.get_shape() / 2)
+        shapes, size, elapsed = benchmark(system, PolarGridConfig(step_r=step))
+
+        print(f'{"polar":<10} {step:>6} {shapes:>7} {size:>10} {elapsed:>9.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+"Helpers for running benchmarks without a Maxwell server."
+
+import numpy as np
+
+from maxwell.client.serializer import get_serializer
+
+
+class OfflineClient:
+    "Stand-in for Client that counts outgoing bytes instead of sending them."
+
+    def __init__(self, shape=(1200, 800), serializer='json', array_dtype=None):
+        self.shape = np.array(shape)
+        self.serializer = get_serializer(serializer, array_dtype)
+
+        self.bytes_sent = 0
+
+    def send_message(self, mess, encoder=None):
+        self.send_payload(self.serializer.dumps(mess, encoder))
+
+    def send_payload(self, payload):
+        self.bytes_sent += len(payload)
+
+    def receive_message(self):
+        raise ConnectionError('An offline client cannot receive messages.')
+
+    def get_shape(self):
+        return self.shape.copy()
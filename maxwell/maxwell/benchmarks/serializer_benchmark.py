@@ -0,0 +1,78 @@
+"""Serialization throughput for a typical renderScene message.
+
+Run with `python -m maxwell.benchmarks.serializer_benchmark`.
+"""
+
+import time
+
+import numpy as np
+
+from maxwell.client.serializer import SERIALIZERS, get_serializer, orjson
+from maxwell.core.coordinates.cartesian.system import CartesianSystem
+from maxwell.core.animation import AnimationConfig
+from maxwell.core.sequence import Sequence
+from maxwell.shapes.curve import Curve, CurveConfig
+from maxwell.shapes.shape import ShapeConfig
+from maxwell.benchmarks.offline import OfflineClient
+
+
+CURVE_NUM = 6
+POINT_NUM = 400
+DURATION = 2
+
+
+def build_message(client):
+    system = CartesianSystem(client, (80, 80), client.get_shape() / 2)
+    shape_config = ShapeConfig(client=client, system=system)
+
+    x_values = np.linspace(-7, 7, POINT_NUM)
+
+    sequence = Sequence(client)
+
+    for i in range(CURVE_NUM):
+        curve = Curve(
+            np.column_stack((x_values, np.sin(x_values + i))),
+            CurveConfig(),
+            shape_config
+        )
+        target = np.column_stack((x_values, np.cos(2*x_values) * i/2))
+
+        sequence.add_scene(curve.transform(
+            target,
+            animation_config=AnimationConfig(duration=DURATION/CURVE_NUM)
+        ))
+
+    return sequence.compile()
+
+
+def benchmark(serializer, message, repeat=5):
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        payload = serializer.dumps(message.message_data, message.encoder)
+
+    elapsed = (time.perf_counter() - start) / repeat
+
+    return len(payload), elapsed
+
+
+def main():
+    client = OfflineClient()
+    message = build_message(client)
+
+    print(f'{"serializer":<10} {"arrays":<8} {"bytes":>12} {"seconds":>9} {"MB/s":>9}')
+
+    for name in SERIALIZERS:
+        if name == 'orjson' and orjson is None:
+            print(f'{name:<10} (not installed)')
+            continue
+
+        for array_dtype in (None, 'float64', 'float32'):
+            serializer = get_serializer(name, array_dtype)
+            size, elapsed = benchmark(serializer, message)
+
+            print(f'{name:<10} {array_dtype or "lists":<8} {size:>12} {elapsed:>9.3f} {size / elapsed / 1e6:>9.1f}')
+
+
+if __name__ == '__main__':
+    main()
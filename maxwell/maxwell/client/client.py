@@ -1,4 +1,7 @@
+import asyncio
+import select
 import socket
+import struct
 import sys
 
 import json
@@ -6,12 +9,53 @@ import json
 import numpy as np
 
 from maxwell.core.util import await_properties
+from maxwell.client.serializer import get_serializer
+
+
+HEADER = struct.Struct('!I')
+RECV_SIZE = 65536
+LINE_LIMIT = 2**24
+
+EVENT_PREFIX = b'{"event"'
+
+
+def get_handshake(framed):
+    "Select the message framing and subscribe to viewport updates."
+
+    handshake = {
+        'command': 'handshake',
+        'args': {
+            'protocol': 'framed' if framed else 'lines',
+            'events': ['shape']
+        }
+    }
+
+    return (json.dumps(handshake) + '\n').encode('utf-8')
 
 
 class Client():
-    def __init__(self, ip='127.0.0.1', port=1337):
+    def __init__(self, ip='127.0.0.1', port=1337, framed=False, array_dtype=None, serializer='json'):
+        """Socket connection to the Maxwell server.
+
+        Arguments:
+        * framed (bool) -- whether messages should be sent with a
+        length header instead of being newline-delimited; negotiated
+        with the server on connect
+        * array_dtype (str) -- 'float32' or 'float64' to send ndarrays
+        as base64-encoded binary buffers instead of nested lists
+        * serializer (str, Serializer) -- 'json' (default), 'orjson',
+        or a serializer instance
+        """
+
         self.ip = ip
         self.port = port
+        self.framed = framed
+        self.serializer = get_serializer(serializer, array_dtype)
+
+        self.buffer = bytearray()
+
+        # Viewport size, kept up to date by the server's shape events.
+        self.viewport_shape = None
 
         self.socket = socket.socket(
             socket.AF_INET,
@@ -21,6 +65,10 @@ class Client():
 
     def connect(self):
         self.socket.connect((self.ip, self.port))
+        self.buffer.clear()
+        self.viewport_shape = None
+
+        self.socket.sendall(get_handshake(self.framed))
 
     def change_server(self, ip, port=1337):
         self.ip = ip
@@ -35,16 +83,308 @@ class Client():
         self.connect()
 
     def send_message(self, mess, encoder=None):
-        if encoder is None:
-            encoder = json.JSONEncoder
+        self.send_payload(self.serializer.dumps(mess, encoder))
+
+    def send_payload(self, payload):
+        "Send an already serialized message."
+
+        if self.socket is None:
+            raise ConnectionError('A detached client cannot send messages.')
 
-        self.socket.sendall((json.dumps(mess, cls=encoder) + '\n').encode('utf-8'))
+        if self.framed:
+            self.socket.sendall(HEADER.pack(len(payload)) + payload)
+        else:
+            self.socket.sendall(payload + b'\n')
 
     def receive_message(self):
-        return self.socket.recv(1024)
+        """Read exactly one complete reply, keeping leftover bytes
+        buffered. Events pushed by the server are handled on the way.
+        """
+
+        while True:
+            if self.framed:
+                size, = HEADER.unpack(self.read_exactly(HEADER.size))
+
+                message = self.read_exactly(size)
+            else:
+                message = self.read_line()
+
+            if not message.startswith(EVENT_PREFIX):
+                return message
+
+            self.handle_event(message)
+
+    def handle_event(self, message):
+        event = json.loads(message)
+
+        if event['event'] == 'shape':
+            self.viewport_shape = np.array([event['width'], event['height']])
+
+    def next_buffered(self):
+        "The next complete message in the buffer and its length on the wire, if any."
+
+        if self.framed:
+            if len(self.buffer) < HEADER.size:
+                return None
+
+            size, = HEADER.unpack_from(self.buffer)
+
+            if len(self.buffer) < HEADER.size + size:
+                return None
+
+            return bytes(self.buffer[HEADER.size:HEADER.size + size]), HEADER.size + size
+
+        index = self.buffer.find(b'\n')
+
+        if index == -1:
+            return None
+
+        return bytes(self.buffer[:index]), index + 1
+
+    def poll_events(self):
+        "Handle events that have already arrived, without blocking."
+
+        while select.select([self.socket], [], [], 0)[0]:
+            data = self.socket.recv(RECV_SIZE)
+
+            if not data:
+                break
+
+            self.buffer += data
+
+        while (buffered := self.next_buffered()) is not None and buffered[0].startswith(EVENT_PREFIX):
+            del self.buffer[:buffered[1]]
+            self.handle_event(buffered[0])
+
+    def fill_buffer(self):
+        data = self.socket.recv(RECV_SIZE)
+
+        if not data:
+            raise ConnectionError('Connection closed by server.')
+
+        self.buffer += data
+
+    def read_exactly(self, size):
+        if size <= RECV_SIZE or size <= len(self.buffer):
+            while len(self.buffer) < size:
+                self.fill_buffer()
+
+            data = bytes(self.buffer[:size])
+            del self.buffer[:size]
+
+            return data
+
+        # Large replies are received straight into a buffer of the
+        # announced size instead of being accumulated in chunks.
+        data = bytearray(size)
+        view = memoryview(data)
+
+        filled = len(self.buffer)
+        view[:filled] = self.buffer
+        self.buffer.clear()
+
+        while filled < size:
+            received = self.socket.recv_into(view[filled:])
+
+            if received == 0:
+                raise ConnectionError('Connection closed by server.')
+
+            filled += received
+
+        return bytes(data)
+
+    def read_line(self):
+        scanned = 0
+
+        while (index := self.buffer.find(b'\n', scanned)) == -1:
+            scanned = len(self.buffer)
+            self.fill_buffer()
+
+        data = bytes(self.buffer[:index])
+        del self.buffer[:index + 1]
+
+        return data
 
     def get_shape(self):
-        return np.array(await_properties(self, ['width', 'height']))
+        if self.socket is not None:
+            self.poll_events()
+
+        if self.viewport_shape is None:
+            return np.array(await_properties(self, ['width', 'height']))
+
+        return self.viewport_shape.copy()
+
+    def ensure_viewport_shape(self):
+        """Ask for the viewport size if the server has not reported it,
+        so that detached copies (see `__getstate__`) know it.
+        """
+
+        if self.viewport_shape is None:
+            self.viewport_shape = self.get_shape()
 
     def close(self):
         self.socket.close()
+
+    def __getstate__(self):
+        """Pickle a detached copy, for rendering in other processes. The
+        copy keeps the last viewport size reported by the server, if
+        any, but cannot send or receive.
+        """
+
+        state = self.__dict__.copy()
+        state['socket'] = None
+        state['buffer'] = bytearray()
+
+        if self.viewport_shape is not None:
+            state['viewport_shape'] = self.viewport_shape.copy()
+
+        return state
+
+
+class AsyncClient():
+    def __init__(self, ip='127.0.0.1', port=1337, framed=False, array_dtype=None, serializer='json'):
+        """Asyncio connection to the Maxwell server.
+
+        Requests are tagged with an ID so that many of them can be in
+        flight at once; replies resolve the matching futures as they
+        arrive. Call `connect` (a coroutine) before use.
+        """
+
+        self.ip = ip
+        self.port = port
+        self.framed = framed
+        self.serializer = get_serializer(serializer, array_dtype)
+
+        self.reader = None
+        self.writer = None
+        self.listener = None
+
+        self.request_id = 0
+        self.pending = {}
+        self.replies = asyncio.Queue()
+
+        # The exception that stopped the listener, if it has stopped.
+        self.error = None
+
+        self.viewport_shape = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(
+            self.ip, self.port, limit=LINE_LIMIT
+        )
+
+        self.writer.write(get_handshake(self.framed))
+
+        self.listener = asyncio.create_task(self.listen())
+
+        return self
+
+    async def send_message(self, mess, encoder=None):
+        await self.send_payload(self.serializer.dumps(mess, encoder))
+
+    async def send_payload(self, payload):
+        "Send an already serialized message."
+
+        if self.framed:
+            self.writer.write(HEADER.pack(len(payload)) + payload)
+        else:
+            self.writer.write(payload + b'\n')
+
+        await self.writer.drain()
+
+    def check_listener(self):
+        "Raise the listener's failure, since no further reply can arrive."
+
+        if self.listener is not None and self.listener.done():
+            raise ConnectionError('The connection listener has stopped.') from self.error
+
+    async def request(self, command, **kwargs):
+        "Send a command tagged with a new request ID and await its reply."
+
+        self.check_listener()
+
+        self.request_id += 1
+        request_id = self.request_id
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+
+        message = {
+            'command': command,
+            'args': kwargs,
+            'id': request_id
+        }
+
+        await self.send_message(message)
+
+        return await future
+
+    async def read_reply(self):
+        if self.framed:
+            size, = HEADER.unpack(await self.reader.readexactly(HEADER.size))
+
+            return await self.reader.readexactly(size)
+
+        return (await self.reader.readuntil(b'\n'))[:-1]
+
+    async def listen(self):
+        try:
+            while True:
+                message = json.loads(await self.read_reply())
+
+                if isinstance(message, dict) and 'event' in message:
+                    if message['event'] == 'shape':
+                        self.viewport_shape = np.array([message['width'], message['height']])
+                elif isinstance(message, dict) and 'id' in message:
+                    future = self.pending.pop(message['id'], None)
+
+                    if future is not None and not future.done():
+                        future.set_result(message['result'])
+                else:
+                    await self.replies.put(message)
+        except Exception as error:
+            self.error = error
+
+            if not isinstance(error, ConnectionError):
+                error = ConnectionError(error)
+
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+            self.pending.clear()
+
+            # Wake a pending `receive_message`.
+            self.replies.put_nowait(error)
+
+    async def receive_message(self):
+        "Await the next reply that was not tagged with a request ID."
+
+        if self.replies.empty():
+            self.check_listener()
+
+        message = await self.replies.get()
+
+        if isinstance(message, Exception):
+            raise message
+
+        return message
+
+    async def await_properties(self, keys):
+        return await self.request('awaitProperties', keys=keys)
+
+    async def await_event(self, event, keys=[]):
+        return await self.request('awaitEvent', dataKeys=keys, type=event)
+
+    async def get_shape(self):
+        if self.viewport_shape is None:
+            return np.array(await self.await_properties(['width', 'height']))
+
+        return self.viewport_shape.copy()
+
+    async def close(self):
+        if self.listener is not None:
+            self.listener.cancel()
+
+        self.writer.close()
+        await self.writer.wait_closed()
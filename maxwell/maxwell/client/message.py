@@ -7,5 +7,10 @@ class Message:
         self.message_data = { 'command': command, 'args': kwargs }
         self.encoder = encoder
 
+    def serialize(self):
+        "Encode the message with the client's serializer."
+
+        return self.client.serializer.dumps(self.message_data, self.encoder)
+
     def send(self):
         self.client.send_message(self.message_data, encoder=self.encoder)
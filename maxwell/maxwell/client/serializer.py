@@ -0,0 +1,92 @@
+"Serialization backends for client messages."
+
+import json
+
+from maxwell.core.properties import PropertiesEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONSerializer:
+    "Standard library JSON; the default backend."
+
+    def __init__(self, array_dtype=None):
+        """Arguments:
+        * array_dtype (str) -- 'float32' or 'float64' to send ndarrays
+        as base64-encoded binary buffers instead of nested lists
+        """
+
+        self.array_dtype = array_dtype
+
+
+    def dumps(self, obj, encoder=None):
+        if encoder is None:
+            encoder = PropertiesEncoder
+
+        options = {}
+
+        if self.array_dtype is not None and issubclass(encoder, PropertiesEncoder):
+            options['array_dtype'] = self.array_dtype
+
+        return json.dumps(obj, cls=encoder, **options).encode('utf-8')
+
+
+class OrjsonSerializer:
+    """orjson backend. Produces the same JSON messages, except that
+    non-finite floats are sent as null, which the renderer also treats
+    as a discontinuity.
+    """
+
+    def __init__(self, array_dtype=None):
+        if orjson is None:
+            raise ImportError('The orjson serializer requires the orjson package.')
+
+        self.array_dtype = array_dtype
+
+        # Native numpy support would bypass the binary array encoding.
+        self.option = orjson.OPT_NON_STR_KEYS
+
+        if array_dtype is None:
+            self.option |= orjson.OPT_SERIALIZE_NUMPY
+
+        self.encoders = {}
+
+
+    def get_default(self, encoder):
+        "Reuse the encoder's `default` as orjson's fallback."
+
+        if encoder not in self.encoders:
+            if issubclass(encoder, PropertiesEncoder):
+                self.encoders[encoder] = encoder(array_dtype=self.array_dtype).default
+            else:
+                self.encoders[encoder] = encoder().default
+
+        return self.encoders[encoder]
+
+
+    def dumps(self, obj, encoder=None):
+        if encoder is None:
+            encoder = PropertiesEncoder
+
+        return orjson.dumps(obj, default=self.get_default(encoder), option=self.option)
+
+
+SERIALIZERS = {
+    'json': JSONSerializer,
+    'orjson': OrjsonSerializer
+}
+
+
+def get_serializer(serializer='json', array_dtype=None):
+    "Look up a serializer by name; serializer instances pass through."
+
+    if isinstance(serializer, str):
+        if serializer not in SERIALIZERS:
+            raise ValueError(f'Unknown serializer: {serializer}. Options: {", ".join(SERIALIZERS)}.')
+
+        return SERIALIZERS[serializer](array_dtype)
+
+    return serializer
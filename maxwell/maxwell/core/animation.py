@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 
 from numpy.typing import ArrayLike
 import numpy as np
@@ -10,15 +11,130 @@ from maxwell.core.util import partial
 class AnimationConfig:
     duration: float = 2.0
     fps: int = 100
-    easing_function: tuple = tuple()
+    easing_function: tuple | str = tuple()
     shapes: ArrayLike = None
 
 
+def ease_out(ease_in):
+    return lambda u: 1 - ease_in(1 - u)
+
+
+def ease_in_out(ease_in):
+    return lambda u: np.where(u < .5, ease_in(2*u) / 2, 1 - ease_in(2 - 2*u) / 2)
+
+
+# Position curves, from 0 to 1 over u in [0, 1], accelerating from rest.
+EASE_IN = {
+    'sine': lambda u: 1 - np.cos(np.pi/2 * u),
+    'quad': lambda u: u**2,
+    'cubic': lambda u: u**3,
+    'quart': lambda u: u**4,
+    'expo': lambda u: np.where(u > 0, 2**(10*u - 10), 0),
+    'back': lambda u: 2.70158*u**3 - 1.70158*u**2
+}
+
+EASINGS = {
+    'linear': lambda u: u,
+    'elastic': lambda u: 1 + 2**(-10*u) * np.sin((10*u - .75) * 2*np.pi/3),
+    'spring': lambda u: 1 - np.exp(-6*u) * np.cos(4*np.pi*u)
+}
+
+for name, ease_in in EASE_IN.items():
+    EASINGS[name] = ease_in_out(ease_in)
+    EASINGS[f'{name}-in'] = ease_in
+    EASINGS[f'{name}-out'] = ease_out(ease_in)
+
+
+def read_only(array):
+    array.flags.writeable = False
+
+    return array
+
+
+@lru_cache(maxsize=256)
+def get_easing_tables(easing, frame_num):
+    """The increments in progress at each frame, summing to one, and the
+    cumulative progress, ending at one, for an easing: either the name
+    of one in `EASINGS`, or a (func, start, end) tuple whose absolute
+    values over [start, end] are the increments (see
+    `create_easing_function`). Tables are cached and read-only, so that
+    animations can share them.
+    """
+
+    if frame_num <= 0:
+        return read_only(np.zeros(0)), read_only(np.zeros(0))
+
+    if isinstance(easing, str):
+        if easing not in EASINGS:
+            raise ValueError(f'Unknown easing: {easing}. Options: {", ".join(EASINGS)}.')
+
+        positions = EASINGS[easing](np.linspace(0, 1, frame_num + 1))
+        positions = (positions - positions[0]) / (positions[-1] - positions[0])
+
+        increments = np.diff(positions)
+    else:
+        func, start, end = easing
+
+        x_values = np.linspace(start, end, frame_num)
+        y_values = np.abs(func(x_values))
+
+        increments = y_values / y_values.sum()
+
+    progress = np.cumsum(increments)
+
+    if progress[-1] != 0:
+        progress /= progress[-1]
+
+    return read_only(increments), read_only(progress)
+
+
+def normalize_easing(easing):
+    """An easing as a cache key: a name, or a (func, start, end) tuple
+    with float bounds, so that lists or NumPy scalars can be passed.
+    """
+
+    if isinstance(easing, str):
+        return easing
+
+    if not isinstance(easing, (tuple, list)) or len(easing) > 3:
+        raise TypeError(f'Easing should be a name or a (func, start, end) tuple, not {easing!r}.')
+
+    func, start, end = (*easing, *(np.sin, 0, np.pi)[len(easing):])
+
+    if isinstance(func, str):
+        return func
+
+    return func, float(start), float(end)
+
+
+def lookup_easing_tables(easing, frame_num):
+    "Cached `get_easing_tables`, computing them directly for unhashable functions."
+
+    easing = normalize_easing(easing)
+
+    try:
+        hash(easing)
+    except TypeError:
+        return get_easing_tables.__wrapped__(easing, frame_num)
+
+    return get_easing_tables(easing, frame_num)
+
+
 def create_easing_function(step_num, func=np.sin, start=0, end=np.pi):
-    x_values = np.linspace(start, end, step_num)
-    y_values = np.abs(func(x_values))
+    """The increments in progress at each of `step_num` frames, as a
+    new, writable array.
+    """
+
+    return lookup_easing_tables((func, start, end), step_num)[0].copy()
+
+
+def get_easing(frame_num, easing):
+    """The increment and progress tables for an `AnimationConfig`
+    easing: a name, or a tuple of `create_easing_function` arguments.
+    The tables are shared and read-only.
+    """
 
-    return y_values / y_values.sum()
+    return lookup_easing_tables(easing, frame_num)
 
 
 def animate(apply_function):
@@ -32,14 +148,15 @@ def animate(apply_function):
 
         frame_num = int(animation_config.duration * animation_config.fps)
 
-        easing_function = create_easing_function(frame_num, *animation_config.easing_function)
+        easing_function, easing_progress = get_easing(frame_num, animation_config.easing_function)
 
         properties = {
             'easing_function': easing_function,
+            'easing_progress': easing_progress,
             'shape_name': shape.shape_name
         }
 
-        scene = Scene(properties=properties)
+        scene = Scene(properties=properties, fps=animation_config.fps)
 
         scene.add_shape(shape)
 
@@ -54,3 +171,236 @@ def animate(apply_function):
         return scene
 
     return wrapper
+
+
+class Tween:
+    """A shape property interpolated from a start to an end value over a
+    scene's frames. The values for every frame are computed in one array
+    operation when the scene reaches its first frame, so that the start
+    value reflects any earlier scenes.
+    """
+
+    def __init__(self, shape, key, end, start=None, index=None, frames=None, easing=None, to_array=None, from_array=None, on_update=None):
+        """Arguments:
+        * shape -- The shape whose property is animated.
+        * key (str) -- The name of the property.
+        * end -- The final value.
+        * start -- The initial value; the property's value when the
+        scene starts if None.
+        * index -- An item of the property to animate instead of the
+        whole value, such as a single point of a curve.
+        * frames (tuple) -- The (first, stop) range of frames the tween
+        plays over; the whole scene if None.
+        * easing (ArrayLike, str) -- The change in progress at each
+        frame of the range, summing to one, or the name of an easing;
+        the scene's easing if None.
+        * to_array -- Converts the property's value to an array.
+        * from_array -- Converts an interpolated array back into a
+        property value, each time one is set.
+        * on_update -- Called with the shape after each frame.
+        """
+
+        self.shape = shape
+        self.key = key
+        self.end = end
+        self.start = start
+        self.index = index
+        self.frames = frames
+        self.easing = easing
+        self.to_array = to_array
+        self.from_array = from_array
+        self.on_update = on_update
+
+        self.initial = None
+        self.progress = None
+        self.values = None
+
+
+    def get_value(self):
+        value = self.shape.properties[self.key]
+
+        if self.index is not None:
+            value = value[self.index]
+
+        return value
+
+
+    def get_progress(self, easing_function, easing_progress=None):
+        """The progress, from 0 to 1, at each frame of the scene, given
+        the scene's easing increments and, optionally, their cumulative
+        progress table.
+        """
+
+        frame_num = len(easing_function)
+        first, stop = (0, frame_num) if self.frames is None else self.frames
+
+        if self.easing is None and (first, stop) == (0, frame_num) and easing_progress is not None:
+            return easing_progress
+
+        if self.easing is None:
+            steps = np.cumsum(easing_function[first:stop], dtype=float)
+
+            if len(steps) > 0 and steps[-1] != 0:
+                steps /= steps[-1]
+        elif isinstance(self.easing, str):
+            steps = get_easing_tables(self.easing, stop - first)[1]
+        else:
+            steps = np.cumsum(self.easing, dtype=float)
+
+        progress = np.ones(frame_num)
+        progress[:first] = 0
+        progress[first:stop] = steps[:max(stop - first, 0)]
+
+        return progress
+
+
+    def interpolate(self, start, progress):
+        "The values at each frame, given the progress at each."
+
+        end = np.asarray(self.end, dtype=float)
+
+        if np.broadcast_shapes(end.shape, start.shape) != start.shape:
+            raise ValueError(f"Cannot tween '{self.key}' from shape {start.shape} to {end.shape}.")
+
+        progress = progress.reshape(-1, *(1,) * start.ndim)
+
+        return start + progress * (end - start)
+
+
+    def evaluate(self, easing_function, easing_progress=None):
+        "Compute the values for every frame."
+
+        start = self.get_value() if self.start is None else self.start
+
+        if self.to_array is not None:
+            start = self.to_array(start)
+
+        self.initial = np.asarray(start, dtype=float)
+        self.progress = self.get_progress(easing_function, easing_progress)
+
+        self.values = self.interpolate(self.initial, self.progress)
+
+
+    def value_for(self, progress):
+        "The interpolated value at a given progress, from 0 to 1."
+
+        return self.interpolate(self.initial, np.array([progress], dtype=float))[0]
+
+
+    def value_at(self, position):
+        """The value at a fractional frame position, interpolating the
+        progress between frames.
+        """
+
+        positions = np.arange(-1, len(self.progress))
+
+        return self.value_for(np.interp(position, positions, np.concatenate(([0], self.progress))))
+
+
+    def set_value(self, value):
+        "Set an interpolated value, converted with `from_array` if given."
+
+        if self.from_array is not None:
+            value = self.from_array(value)
+        elif isinstance(value, np.ndarray):
+            value = value.copy()
+
+        properties = self.shape.properties
+
+        if self.index is None:
+            properties[self.key] = value
+        else:
+            properties[self.key][self.index] = value
+            properties.mark_changed()
+
+        if self.on_update is not None:
+            self.on_update(self.shape)
+
+
+    def apply(self, i):
+        "Set the property to its value at frame `i`."
+
+        self.set_value(self.values[min(i, len(self.values) - 1)])
+
+
+    def reset(self):
+        "Restore the property's value from before the first frame."
+
+        self.set_value(self.value_for(0))
+
+
+class Rotation(Tween):
+    "Points rotated about an origin, from no rotation to `angle`."
+
+    def __init__(self, shape, key, origin, angle, **kwargs):
+        super().__init__(shape, key, angle, **kwargs)
+
+        self.origin = np.asarray(origin, dtype=float)
+
+
+    def interpolate(self, start, progress):
+        theta = (progress * self.end).reshape(-1, *(1,) * (start.ndim - 1))
+
+        cos = np.cos(theta)
+        sin = np.sin(theta)
+
+        offset = start - self.origin
+        x, y = offset[..., 0], offset[..., 1]
+
+        return np.stack((cos*x - sin*y, sin*x + cos*y), axis=-1) + self.origin
+
+
+class FrameTable(Tween):
+    """A property stepping through values computed up front, one per
+    frame, after the value before the first frame. Fractional frame
+    positions interpolate linearly between neighbouring values.
+    """
+
+    def __init__(self, shape, key, table, **kwargs):
+        """Arguments:
+        * table (ArrayLike) -- The value before the first frame,
+        followed by the value at each frame.
+        """
+
+        super().__init__(shape, key, table[-1], **kwargs)
+
+        self.table = np.asarray(table, dtype=float)
+
+
+    def evaluate(self, easing_function, easing_progress=None):
+        self.values = self.table[1:]
+
+
+    def value_at(self, position):
+        position = np.clip(position + 1, 0, len(self.table) - 1)
+        i = min(int(position), len(self.table) - 2)
+        u = position - i
+
+        before, after = self.table[i], self.table[i + 1]
+        value = (1 - u) * before + u * after
+
+        # Non-finite values, which break curves, are taken from the
+        # nearest frame rather than blended.
+        finite = np.isfinite(before) & np.isfinite(after)
+
+        return np.where(finite, value, before if u < 0.5 else after)
+
+
+    def reset(self):
+        self.set_value(self.table[0])
+
+
+def setup_tweens(frame, props):
+    "Setup for tween frames."
+
+    easing_progress = props.easing_progress if 'easing_progress' in props else None
+
+    for tween in props.tweens:
+        tween.evaluate(props.easing_function, easing_progress)
+
+
+def apply_tweens(frame, props):
+    "Callback for tween frames."
+
+    for tween in props.tweens:
+        tween.apply(props.i)
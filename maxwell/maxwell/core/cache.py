@@ -0,0 +1,246 @@
+"Memoization of sampled plot values."
+
+import os
+import types
+import hashlib
+import functools
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+SIMPLE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+def hash_value(value, digest, seen):
+    """Feed a value that a function depends on into a digest. Returns
+    False if the value's content cannot be hashed reliably.
+    """
+
+    if isinstance(value, SIMPLE_TYPES) or isinstance(value, np.generic):
+        digest.update(repr(value).encode())
+    elif isinstance(value, (tuple, list, frozenset)):
+        digest.update(type(value).__name__.encode())
+
+        return all(hash_value(item, digest, seen) for item in value)
+    elif isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return False
+
+        digest.update(f'{value.dtype}{value.shape}'.encode())
+        digest.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, types.ModuleType):
+        digest.update(value.__name__.encode())
+    elif isinstance(value, types.CodeType):
+        digest.update(value.co_code)
+        digest.update(repr(value.co_names).encode())
+
+        return all(hash_value(const, digest, seen) for const in value.co_consts)
+    elif callable(value):
+        return hash_function(value, digest, seen)
+    else:
+        return False
+
+    return True
+
+
+def get_global_names(code):
+    """The names a code object may read as globals, including those of
+    the functions and lambdas nested in it.
+    """
+
+    names = set(code.co_names)
+
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= get_global_names(const)
+
+    return names
+
+
+def hash_function(func, digest, seen):
+    if id(func) in seen:
+        digest.update(b'<recursion>')
+        return True
+
+    seen.add(id(func))
+
+    if isinstance(func, np.ufunc):
+        digest.update(f'ufunc:{func.__name__}'.encode())
+    elif isinstance(func, (types.BuiltinFunctionType, types.BuiltinMethodType)):
+        digest.update(f'builtin:{func.__module__}.{func.__qualname__}'.encode())
+    elif isinstance(func, functools.partial):
+        return (
+            hash_function(func.func, digest, seen)
+            and hash_value(func.args, digest, seen)
+            and hash_value(sorted(func.keywords.items()), digest, seen)
+        )
+    elif isinstance(func, types.FunctionType):
+        code = func.__code__
+
+        if not hash_value(code, digest, seen):
+            return False
+
+        if not hash_value(func.__defaults__, digest, seen):
+            return False
+
+        for cell in func.__closure__ or ():
+            try:
+                contents = cell.cell_contents
+            except ValueError:
+                contents = None
+
+            if not hash_value(contents, digest, seen):
+                return False
+
+        # Globals the function reads, such as constants or helpers.
+        for name in sorted(get_global_names(code)):
+            if name in func.__globals__:
+                digest.update(name.encode())
+
+                if not hash_value(func.__globals__[name], digest, seen):
+                    return False
+    elif hasattr(func, '__wrapped__'):
+        digest.update(type(func).__qualname__.encode())
+
+        return hash_function(func.__wrapped__, digest, seen)
+    else:
+        return False
+
+    return True
+
+
+def function_key(func):
+    """A key that identifies a function by its behaviour: a hash of its
+    code, constants, defaults, closure, and the globals it reads. None
+    if the function depends on something whose content cannot be
+    hashed (such as a mutable object), in which case it is not cached.
+    """
+
+    digest = hashlib.sha256()
+
+    if hash_function(func, digest, set()):
+        return digest.hexdigest()
+
+    return None
+
+
+class PlotCache:
+    """A least-recently-used cache of sampled plot values, optionally
+    persisted to disk. Disabled until `enable` is called.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.max_entries = 128
+        self.path = None
+
+        self.entries = OrderedDict()
+
+
+    def enable(self, max_entries=128, path=None):
+        """Arguments:
+        * max_entries -- The number of results kept in memory.
+        * path -- A directory to persist results in, so that they
+        survive restarts.
+        """
+
+        self.enabled = True
+        self.max_entries = max_entries
+        self.path = path
+
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+
+    def disable(self):
+        self.enabled = False
+        self.clear()
+
+
+    def clear(self):
+        self.entries.clear()
+
+
+    def make_key(self, funcs, *args):
+        keys = tuple(function_key(func) for func in funcs)
+
+        if None in keys:
+            return None
+
+        return keys, args
+
+
+    def get_file(self, key):
+        if self.path is None:
+            return None
+
+        name = hashlib.sha256(repr(key).encode()).hexdigest()
+
+        return os.path.join(self.path, f'{name}.npz')
+
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+
+            return tuple(array.copy() for array in self.entries[key])
+
+        file = self.get_file(key)
+
+        if file is not None and os.path.exists(file):
+            with np.load(file) as data:
+                value = tuple(data[f'arr_{i}'] for i in range(len(data.files)))
+
+            self.store(key, value)
+
+            return tuple(array.copy() for array in value)
+
+        return None
+
+
+    def store(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+    def put(self, key, value):
+        value = tuple(np.array(array) for array in value)
+
+        self.store(key, value)
+
+        file = self.get_file(key)
+
+        if file is not None:
+            np.savez(file, *value)
+
+
+    def cached(self, funcs, compute, *args):
+        """Return `compute()` for the given functions and arguments,
+        reusing an earlier result if there is one.
+        """
+
+        if not self.enabled:
+            return compute()
+
+        key = self.make_key(funcs, *args)
+
+        if key is None:
+            return compute()
+
+        value = self.get(key)
+
+        if value is None:
+            value = compute()
+            self.put(key, value)
+
+            return tuple(array.copy() for array in value)
+
+        return value
+
+
+PLOT_CACHE = PlotCache()
@@ -0,0 +1,251 @@
+"Incremental maintenance of cartesian grids."
+
+import numpy as np
+
+from maxwell.core.group import Group
+from maxwell.core.util import default_formatter
+from maxwell.shapes.curve import Curve, CurveConfig
+from maxwell.shapes.shape import ShapeConfig
+from maxwell.shapes.latex import Latex
+
+
+# Horizontal lines belong to the `x-` families (and carry y labels),
+# vertical lines to the `y-` families, as in `CartesianSystem.get_grid`.
+LINE_FAMILIES = {
+    'x-primary': (1, 0),
+    'x-secondary': (1, 1/2),
+    'y-primary': (0, 0),
+    'y-secondary': (0, 1/2)
+}
+
+LABEL_FAMILIES = {
+    'y-label': 1,
+    'x-label': 0
+}
+
+
+class GridManager:
+    """Keeps a cartesian grid's lines and labels in sync with the
+    viewport. Shapes are indexed by integer step, so that `update` only
+    creates or removes those entering or leaving the viewport, reusing
+    removed shapes from a pool. Lines extend a viewport beyond the
+    visible area and are only stretched again once that margin runs
+    out; labels are only moved again when the scale changes. `render`
+    likewise only draws the shapes added since the last render, unless
+    the origin or scale changed, which moves every shape on screen.
+    """
+
+    def __init__(self, system, grid_config):
+        self.system = system
+        self.grid_config = grid_config
+
+        self.shape_config = ShapeConfig(client=system.client, system=system)
+
+        self.group = Group(background=True)
+
+        self.visible = {family: {} for family in (*LINE_FAMILIES, *LABEL_FAMILIES)}
+        self.pools = {family: [] for family in self.visible}
+
+        self.extent = None
+        self.scale = None
+
+        # Names of shapes added since the last render, and whether
+        # every shape has to be drawn again.
+        self.added = set()
+        self.redraw = True
+        self.rendered_view = None
+
+        primary_config = CurveConfig(width=2, color=grid_config.primary_color)
+        axis_config = CurveConfig(width=2, color='#474747')
+
+        self.line_configs = {
+            'primary': primary_config,
+            'secondary': CurveConfig(width=1, color=grid_config.secondary_color)
+        }
+
+        self.axes = {}
+
+        for name in ('x-axis', 'y-axis'):
+            self.axes[name] = Curve(
+                [(0, 0), (0, 0)],
+                curve_config=axis_config if grid_config.show_axes else primary_config,
+                shape_config=self.shape_config
+            )
+            self.group.add_shape(self.axes[name], name)
+
+
+    def get_view(self):
+        width, height = self.system.client.get_shape()
+
+        left, top = self.system.from_normalized((0, 0))
+        right, bottom = self.system.from_normalized((width, height))
+
+        return np.array([[left, right], [bottom, top]])
+
+
+    def get_step(self, axis):
+        return (self.grid_config.step_x, self.grid_config.step_y)[axis]
+
+
+    def get_indices(self, family, view):
+        if family in LINE_FAMILIES:
+            axis, shift = LINE_FAMILIES[family]
+        else:
+            axis, shift = LABEL_FAMILIES[family], 0
+
+        step = self.get_step(axis)
+        low, high = view[axis]
+
+        indices = range(int(np.ceil(low / step + shift)), int(np.floor(high / step + shift)) + 1)
+
+        if family.endswith('primary') or family.endswith('label'):
+            return {i for i in indices if i != 0}
+
+        return set(indices)
+
+
+    def place_line(self, family, shape, i):
+        axis, shift = LINE_FAMILIES[family]
+        position = (i - shift) * self.get_step(axis)
+
+        if axis == 1:
+            (left, right), _ = self.extent
+            shape.set_points([(left, position), (right, position)])
+        else:
+            _, (bottom, top) = self.extent
+            shape.set_points([(position, top), (position, bottom)])
+
+
+    def place_label(self, family, shape, i):
+        axis = LABEL_FAMILIES[family]
+
+        if axis == 1:
+            offset = self.grid_config.y_label_offset
+            point = np.array((0, i * self.grid_config.step_y))
+        else:
+            offset = self.grid_config.x_label_offset
+            point = np.array((i * self.grid_config.step_x, 0))
+
+        shape.properties.point = point + np.array(offset) / self.system.scale
+
+
+    def create_shape(self, family, i):
+        if family in LINE_FAMILIES:
+            config = self.line_configs['secondary' if family.endswith('secondary') else 'primary']
+
+            return Curve([(0, 0), (0, 0)], curve_config=config, shape_config=self.shape_config)
+
+        axis = LABEL_FAMILIES[family]
+
+        return Latex(
+            '',
+            latex_config=(self.grid_config.x_label_config, self.grid_config.y_label_config)[axis],
+            shape_config=self.shape_config
+        )
+
+
+    def get_label(self, family, i):
+        if LABEL_FAMILIES[family] == 1:
+            value = i * self.grid_config.step_y
+            label_format = self.grid_config.y_label_format
+        else:
+            value = i * self.grid_config.step_x
+            label_format = self.grid_config.x_label_format
+
+        return (label_format or default_formatter)(value)
+
+
+    def get_name(self, family, i):
+        if family in LINE_FAMILIES:
+            return f'{family}-({i})'
+
+        return f'{family}-{i}'
+
+
+    def update(self):
+        "Bring the grid up to date with the system's origin and scale."
+
+        view = self.get_view()
+
+        stretch = self.extent is None\
+            or (view[:, 0] < self.extent[:, 0]).any()\
+            or (view[:, 1] > self.extent[:, 1]).any()
+
+        if stretch:
+            size = view[:, 1] - view[:, 0]
+            self.extent = view + np.column_stack((-size, size))
+
+            (left, right), (bottom, top) = self.extent
+
+            self.axes['x-axis'].set_points([(left, 0), (right, 0)])
+            self.axes['y-axis'].set_points([(0, top), (0, bottom)])
+
+            self.redraw = True
+
+        rescale = self.scale is None or not np.array_equal(self.scale, self.system.scale)
+        self.scale = np.array(self.system.scale)
+
+        families = list(LINE_FAMILIES)
+
+        if self.grid_config.show_numbers:
+            families += list(LABEL_FAMILIES)
+
+        for family in families:
+            is_line = family in LINE_FAMILIES
+
+            visible = self.visible[family]
+            pool = self.pools[family]
+
+            indices = self.get_indices(family, view)
+
+            for i in visible.keys() - indices:
+                shape = visible.pop(i)
+
+                self.group.remove_shape(shape.shape_name)
+                self.added.discard(shape.shape_name)
+                pool.append(shape)
+
+            for i in indices:
+                if i in visible:
+                    shape = visible[i]
+
+                    if is_line and stretch:
+                        self.place_line(family, shape, i)
+                    elif not is_line and rescale:
+                        self.place_label(family, shape, i)
+
+                    continue
+
+                shape = pool.pop() if pool else self.create_shape(family, i)
+
+                if is_line:
+                    self.place_line(family, shape, i)
+                else:
+                    shape.properties.source = self.get_label(family, i)
+                    self.place_label(family, shape, i)
+
+                visible[i] = shape
+                self.group.add_shape(shape, self.get_name(family, i))
+                self.added.add(shape.shape_name)
+
+        return self.group
+
+
+    def render(self):
+        """Draw the grid's changes since the last render. Shapes that
+        left the viewport are off screen already, so only the added
+        ones are sent, unless the view moved and all of them are.
+        """
+
+        view = (tuple(self.system.origin), tuple(self.system.scale))
+
+        if self.redraw or view != self.rendered_view:
+            self.group.render()
+        elif self.added:
+            Group([self.group.shapes[name] for name in self.added], background=True).render()
+
+        self.added = set()
+        self.redraw = False
+        self.rendered_view = view
+
+        return self.group
@@ -9,12 +9,16 @@ import numpy as np
 
 from maxwell.core.coordinates.system import System
 from maxwell.core.group import Group
-from maxwell.core.util import pi_format, fraction_format, is_light_mode
+from maxwell.core.util import pi_format, fraction_format, default_formatter, is_light_mode, evaluate, evaluate_grid
 from maxwell.shapes.curve import Curve, CurveConfig
 from maxwell.shapes.shape import ShapeConfig
+from maxwell.shapes.grid import Grid
+from maxwell.core.coordinates.cartesian.grid import GridManager
 from maxwell.shapes.latex import Latex, LatexConfig
-from maxwell.core.animation import AnimationConfig, create_easing_function
+from maxwell.core.animation import AnimationConfig, FrameTable, get_easing
 from maxwell.core.scene import Scene
+from maxwell.core.sampling import adaptive_sample
+from maxwell.core.cache import PLOT_CACHE
 
 
 @dataclass
@@ -33,12 +37,6 @@ class CartesianGridConfig:
     secondary_color: str = '#6664'
 
 
-def default_formatter(x):
-    if np.isclose(x, int(x)):
-        return str(int(x))
-    return '{:.2f}'.format(x)
-
-
 class CartesianSystem(System):
     "The cartesian coordinate system"
 
@@ -58,12 +56,13 @@ class CartesianSystem(System):
             return np.empty((0, 2))
 
         if isinstance(obj, (np.ndarray, list, tuple)):
-            obj = np.array(obj)
+            matrix, _ = self.get_affine()
 
-            points = obj * self.scale * np.array([1, -1]) + self.origin
-            return points
+            return np.asarray(obj, dtype=float) * matrix.diagonal()[:2] + matrix[:2, 2]
         elif isinstance(obj, (int, float)):
-            return obj * self.scale.sum()/2
+            matrix, _ = self.get_affine()
+
+            return obj * (matrix[0, 0] - matrix[1, 1])/2
 
         raise TypeError(f'Argument should be ndarray, list, tuple, or scalar. Type used: {type(obj)}.')
 
@@ -75,12 +74,13 @@ class CartesianSystem(System):
             return np.empty((0, 2))
 
         if isinstance(obj, (np.ndarray, list, tuple)):
-            obj = np.array(obj)
+            _, inverse = self.get_affine()
 
-            points = (obj - self.origin) / (self.scale * np.array([1, -1]))
-            return points
+            return np.asarray(obj, dtype=float) * inverse.diagonal()[:2] + inverse[:2, 2]
         elif isinstance(obj, (int, float)):
-            return obj / (self.scale.sum()/2)
+            matrix, _ = self.get_affine()
+
+            return obj / ((matrix[0, 0] - matrix[1, 1])/2)
 
         raise TypeError(f'Argument should be ndarray, list, tuple, or scalar. Type used: {type(obj)}.')
 
@@ -106,7 +106,7 @@ class CartesianSystem(System):
         return edges[0]
 
 
-    def compute_plot(self, func, start, end, point_num, clip_factor, endpoint, invert):
+    def compute_plot(self, func, start, end, point_num, clip_factor, endpoint, invert, vectorized=None, adaptive=False, tolerance=.5):
         if invert:
             if start is None:
                 start = self.get_edges('bottom')
@@ -120,8 +120,36 @@ class CartesianSystem(System):
             if end is None:
                 end = self.get_edges('right')
 
-        x_values = np.linspace(start, end, point_num, endpoint=bool(endpoint & 2))[int(not endpoint & 1):]
-        y_values = np.vectorize(func)(x_values).astype(float)
+        key = [float(start), float(end), point_num, endpoint, bool(adaptive)]
+
+        if adaptive:
+            scale = np.broadcast_to(self.scale, 2)
+            scale = tuple(map(float, scale[::-1] if invert else scale))
+            bounds = tuple(map(float, self.get_edges('left right' if invert else 'bottom top')))
+
+            key += [tolerance, scale, bounds]
+
+            def sample():
+                x_values, y_values = adaptive_sample(
+                    func, start, end,
+                    scale,
+                    bounds,
+                    max_points=point_num,
+                    tolerance=tolerance,
+                    vectorized=vectorized
+                )
+
+                included = slice(int(not endpoint & 1), len(x_values) - int(not endpoint & 2))
+
+                return x_values[included], y_values[included]
+        else:
+            def sample():
+                x_values = np.linspace(start, end, point_num, endpoint=bool(endpoint & 2))[int(not endpoint & 1):]
+                y_values = evaluate(func, x_values, vectorized).astype(float)
+
+                return x_values, y_values
+
+        x_values, y_values = PLOT_CACHE.cached((func,), sample, 'plot', *key)
 
         if invert:
             x_values, y_values = y_values, x_values
@@ -134,7 +162,12 @@ class CartesianSystem(System):
         return x_values, y_values, start, end
 
 
-    def plot(self, func, start=None, end=None, color=None, width=None, point_num=400, clip_factor=np.inf, endpoint=3, shade=None, render=True, invert=False, curve_config: CurveConfig = None, shape_config: ShapeConfig = None):
+    def plot(self, func, start=None, end=None, color=None, width=None, point_num=400, clip_factor=np.inf, endpoint=3, shade=None, render=True, invert=False, vectorized=None, adaptive=False, tolerance=.5, curve_config: CurveConfig = None, shape_config: ShapeConfig = None):
+        """Plot a function. With `adaptive`, up to `point_num` points are
+        placed where the curve needs them to stay within `tolerance`
+        pixels, and the curve is split at discontinuities.
+        """
+
         if isinstance(func, (float, int)):
             constant = func
             func = lambda x: constant
@@ -156,7 +189,7 @@ class CartesianSystem(System):
 
         shape_config.system = self
 
-        x_values, y_values, start, end = self.compute_plot(func, start, end, point_num, clip_factor, endpoint, invert)
+        x_values, y_values, start, end = self.compute_plot(func, start, end, point_num, clip_factor, endpoint, invert, vectorized, adaptive, tolerance)
 
         curve = Curve(zip(x_values, y_values), curve_config, shape_config)
 
@@ -166,7 +199,7 @@ class CartesianSystem(System):
         if shade is not None:
             point_num = int((shade[1] - shade[0]) / (end - start) * point_num)
             x_values = np.linspace(shade[0], shade[1], point_num, endpoint=bool(endpoint & 2))[int(not endpoint & 1):]
-            y_values = np.vectorize(func)(x_values)
+            y_values = evaluate(func, x_values, vectorized)
 
             if invert:
                 x_values, y_values = y_values, x_values
@@ -178,7 +211,7 @@ class CartesianSystem(System):
                     shade_points.append((0, shade[0]))
                 else:
                     shade_points += list(zip(
-                        np.vectorize(shade[2])(y_values),
+                        evaluate(shade[2], y_values),
                         y_values
                     ))[::-1]
             else:
@@ -190,7 +223,7 @@ class CartesianSystem(System):
                 else:
                     shade_points += list(zip(
                         x_values,
-                        np.vectorize(shade[2])(x_values)
+                        evaluate(shade[2], x_values)
                     ))[::-1]
 
             shade_points.append((x_values[0], y_values[0]))
@@ -216,7 +249,7 @@ class CartesianSystem(System):
         return curve
 
 
-    def parametric(self, x, y, start, end, color=None, point_num=400, endpoint=3, render=True, curve_config: CurveConfig = None, shape_config: ShapeConfig = None):
+    def parametric(self, x, y, start, end, color=None, point_num=400, endpoint=3, render=True, vectorized=None, curve_config: CurveConfig = None, shape_config: ShapeConfig = None):
         if isinstance(x, (float, int)):
             constant = x
             x = lambda _: constant
@@ -236,9 +269,17 @@ class CartesianSystem(System):
 
         shape_config.system = self
 
-        t_values = np.linspace(start, end, point_num, endpoint=bool(endpoint & 2))[int(not endpoint & 1):]
-        x_values = np.vectorize(x)(t_values).astype(float)
-        y_values = np.vectorize(y)(t_values).astype(float)
+        def sample():
+            t_values = np.linspace(start, end, point_num, endpoint=bool(endpoint & 2))[int(not endpoint & 1):]
+            x_values = evaluate(x, t_values, vectorized).astype(float)
+            y_values = evaluate(y, t_values, vectorized).astype(float)
+
+            return x_values, y_values
+
+        x_values, y_values = PLOT_CACHE.cached(
+            (x, y), sample,
+            'parametric', float(start), float(end), point_num, endpoint
+        )
 
         x_values[np.isnan(x_values)] = np.inf
         y_values[np.isnan(y_values)] = np.inf
@@ -251,23 +292,42 @@ class CartesianSystem(System):
         return curve
 
 
-    @staticmethod
-    def animate_param_apply(frame, props):
-        "Callback for transformation frames."
+    def compute_param_frames(self, func, t_values, x_start, x_end, point_num, clip_factor, endpoint, invert, vectorized=None):
+        """Compute the curve for every parameter value at once, as a
+        (len(t_values), points, 2) array.
+        """
+
+        width, height = self.client.get_shape()
+        left, top = self.from_normalized((0, 0))
+        right, bottom = self.from_normalized((width, height))
+
+        if x_start is None:
+            x_start = bottom if invert else left
+
+        if x_end is None:
+            x_end = top if invert else right
+
+        x_values = np.linspace(x_start, x_end, point_num, endpoint=bool(endpoint & 2))[int(not endpoint & 1):]
+        y_values = evaluate_grid(func, x_values, t_values, vectorized).astype(float)
 
-        ratio = props.easing_ratio
+        y_values[np.isnan(y_values)] = np.inf
 
-        props.t += props.ct * ratio
+        frames = np.empty((len(t_values), len(x_values), 2))
 
-        shape = frame.scene.shapes['graph']
+        frames[..., int(invert)] = x_values
+        frames[..., int(not invert)] = y_values
 
-        x_values, y_values, *_ = props.compute(props.t)
+        frames[..., 1][np.abs(frames[..., 1]) > abs(bottom) * clip_factor] = np.inf
 
-        shape.set_points(zip(x_values, y_values))
+        return frames
 
 
-    def animate_param(self, func, t_start, t_end, duration=None, easing=None, x_start=None, x_end=None, color=None, point_num=400, clip_factor=np.inf, endpoint=3, invert=False, curve_config: CurveConfig=None, shape_config: ShapeConfig=None, animation_config: AnimationConfig=None):
-        "Create a scene animating a parameter."
+    def animate_param(self, func, t_start, t_end, duration=None, easing=None, x_start=None, x_end=None, color=None, point_num=400, clip_factor=np.inf, endpoint=3, invert=False, vectorized=None, curve_config: CurveConfig=None, shape_config: ShapeConfig=None, animation_config: AnimationConfig=None):
+        """Create a scene animating a parameter. Every frame is computed
+        up front, with `func(x, t)` evaluated over the whole grid of
+        x and t values in a single call when it broadcasts, and frames
+        in between are interpolated when the scene is resampled.
+        """
 
         if shape_config is None:
             shape_config = ShapeConfig()
@@ -276,10 +336,7 @@ class CartesianSystem(System):
             animation_config = AnimationConfig()
 
         if easing is None:
-            animation_config = replace(
-                animation_config,
-                easing_function=(lambda x: np.ones(x.shape), 0, 1)
-            )
+            animation_config = replace(animation_config, easing_function='linear')
         else:
             animation_config = replace(animation_config, easing_function=easing)
 
@@ -296,48 +353,47 @@ class CartesianSystem(System):
 
         frame_num = int(animation_config.duration * animation_config.fps)
 
-        easing_function = create_easing_function(
-            frame_num,
-            *animation_config.easing_function
-        )
-
-        scene_properties = {
-            't': t_start,
-            'ct': t_end - t_start,
-            'compute': lambda t: self.compute_plot(
-                lambda x: func(x, t),
-                x_start, x_end,
-                point_num,
-                clip_factor,
-                endpoint,
-                invert
-            ),
-            'easing_function': easing_function
-        }
+        easing_function, easing_progress = get_easing(frame_num, animation_config.easing_function)
 
-        scene = Scene(self.client, scene_properties)
+        t_values = t_start + (t_end - t_start) * np.concatenate(([0], easing_progress))
 
-        graph = self.plot(
-            lambda x: func(x, t_start),
+        frames = self.compute_param_frames(
+            func, t_values,
             x_start, x_end,
-            color=color,
-            point_num=point_num,
-            curve_config=curve_config,
-            shape_config=replace(shape_config, shape_name='graph'),
-            render=False
+            point_num,
+            clip_factor,
+            endpoint,
+            invert,
+            vectorized
         )
 
-        scene.add_shape(graph)
+        scene = Scene(self.client, {'easing_function': easing_function}, fps=animation_config.fps)
 
-        scene.repeat_frame(
-            frame_num,
-            CartesianSystem.animate_param_apply
+        graph = Curve(
+            frames[0],
+            curve_config,
+            replace(shape_config, shape_name='graph')
         )
 
+        scene.add_shape(graph)
+
+        scene.add_tweens(frame_num, [
+            graph.get_points_tween(FrameTable, frames),
+            FrameTable(scene, 't', t_values, from_array=float)
+        ])
+
         return scene
 
 
-    def get_grid(self, zoom_factor=None, translation=None, grid_config: CartesianGridConfig = None, render=True):
+    def get_grid(self, zoom_factor=None, translation=None, grid_config: CartesianGridConfig = None, render=True, compound=False, incremental=False):
+        """Create grid and axes. With `compound`, the grid is a single
+        `Grid` shape whose lines are generated by the renderer, instead
+        of a group of curves and labels. With `incremental`, the group
+        is kept by a `GridManager` and later calls (after panning or
+        zooming) only add and remove the lines and labels that entered
+        or left the viewport.
+        """
+
         if grid_config is None:
             grid_config = CartesianGridConfig()
 
@@ -345,11 +401,43 @@ class CartesianSystem(System):
             self.zoom(zoom_factor)
 
             if isinstance(zoom_factor, (tuple, list, np.ndarray)):
-                grid_config.step_x = 1/zoom_factor[0]
-                grid_config.step_y = 1/zoom_factor[1]
+                step_x, step_y = 1/zoom_factor[0], 1/zoom_factor[1]
             else:
-                grid_config.step_x = 1/zoom_factor
-                grid_config.step_y = 1/zoom_factor
+                step_x = step_y = 1/zoom_factor
+
+            # Copy rather than mutate the caller's config, which may be
+            # the one a `GridManager` was created with.
+            grid_config = replace(grid_config, step_x=step_x, step_y=step_y)
+
+        if compound:
+            if translation is not None:
+                self.translate(translation)
+
+            grid = Grid(
+                grid_config,
+                shape_config=ShapeConfig(client=self.client, system=self, canvas='background')
+            )
+
+            if render:
+                grid.render()
+
+            return grid
+
+        if incremental:
+            if translation is not None:
+                self.translate(translation)
+
+            grid_manager = getattr(self, 'grid_manager', None)
+
+            if grid_manager is None or grid_manager.grid_config != grid_config:
+                self.grid_manager = GridManager(self, replace(grid_config))
+
+            grid_group = self.grid_manager.update()
+
+            if render:
+                self.grid_manager.render()
+
+            return grid_group
 
         shape_config = ShapeConfig(client=self.client, system=self)
         axis_config = CurveConfig(width=2, color='#474747')
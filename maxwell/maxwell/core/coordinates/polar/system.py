@@ -7,7 +7,7 @@ import numpy as np
 
 from maxwell.core.coordinates.system import System
 from maxwell.core.group import Group
-from maxwell.core.util import pi_format, is_light_mode
+from maxwell.core.util import pi_format, is_light_mode, evaluate
 from maxwell.shapes.curve import Curve, CurveConfig
 from maxwell.shapes.shape import ShapeConfig
 from maxwell.shapes.latex import Latex, LatexConfig
@@ -29,6 +29,19 @@ class PolarGridConfig:
     secondary_label_config: LatexConfig = LatexConfig(color='#555', font_size=8)
 
 
+def join_segments(segments):
+    """Join a batch of (N, k, 2) polylines into a single (N*(k + 1) - 1, 2)
+    polyline, separated by non-finite points that curves draw as breaks.
+    """
+
+    count, length, _ = segments.shape
+
+    joined = np.full((count, length + 1, 2), np.inf)
+    joined[:, :length] = segments
+
+    return joined.reshape(-1, 2)[:-1]
+
+
 def near_multiple(a, b):
     div = a / b
 
@@ -39,22 +52,36 @@ class PolarSystem(System):
     "The polar coordinate system"
 
     @staticmethod
-    def to_cartesian(point):
-        r, theta = point
-        x = r*np.cos(theta)
-        y = r*np.sin(theta)
-        return x, y
+    def to_cartesian(points):
+        """Convert (r, theta) points, along the last axis, to (x, y).
+        Points with a non-finite coordinate become (inf, inf), which
+        curves draw as a break.
+        """
+
+        points = np.asarray(points, dtype=float)
+        r, theta = points[..., 0], points[..., 1]
+
+        with np.errstate(invalid='ignore'):
+            cartesian = np.stack((r*np.cos(theta), r*np.sin(theta)), axis=-1)
+        cartesian[~(np.isfinite(r) & np.isfinite(theta))] = np.inf
+
+        return cartesian
 
 
     @staticmethod
-    def to_polar(point):
-        x, y = point
-        r = np.hypot(x, y)
-        theta = np.arctan2(y, x)
-        return r, theta
+    def to_polar(points):
+        "Convert (x, y) points, along the last axis, to (r, theta)."
 
+        points = np.asarray(points, dtype=float)
+        x, y = points[..., 0], points[..., 1]
 
-    def plot(self, func, start, end, color=None, point_num=400, render=True, curve_config: CurveConfig = None, shape_config: ShapeConfig = None):
+        polar = np.stack((np.hypot(x, y), np.arctan2(y, x)), axis=-1)
+        polar[~(np.isfinite(x) & np.isfinite(y))] = np.inf
+
+        return polar
+
+
+    def plot(self, func, start, end, color=None, point_num=400, render=True, vectorized=None, curve_config: CurveConfig = None, shape_config: ShapeConfig = None):
         if shape_config is None:
             shape_config = ShapeConfig()
 
@@ -71,7 +98,7 @@ class PolarSystem(System):
         shape_config.system = self
 
         theta = np.linspace(start, end, point_num)
-        r = np.vectorize(func)(theta)
+        r = evaluate(func, theta, vectorized)
 
         curve = Curve(zip(r, theta), curve_config, shape_config)
 
@@ -88,11 +115,9 @@ class PolarSystem(System):
             return np.empty((0, 2))
 
         if isinstance(obj, (np.ndarray, list, tuple)):
-            obj = np.array(obj)
-            obj = np.apply_along_axis(PolarSystem.to_cartesian, -1, obj)
+            matrix, _ = self.get_affine()
 
-            points = obj * self.scale * np.array([1, -1]) + self.origin
-            return points
+            return PolarSystem.to_cartesian(obj) * matrix.diagonal()[:2] + matrix[:2, 2]
 
         raise TypeError(f'Argument should be ndarray, list, or tuple. Type used: {type(obj)}.')
 
@@ -104,16 +129,30 @@ class PolarSystem(System):
             return np.empty((0, 2))
 
         if isinstance(obj, (np.ndarray, list, tuple)):
-            obj = np.array(obj)
+            _, inverse = self.get_affine()
 
-            points = (obj - self.origin) / (self.scale * np.array([1, -1]))
-            points = np.apply_along_axis(PolarSystem.to_polar, -1, points)
+            points = np.asarray(obj, dtype=float) * inverse.diagonal()[:2] + inverse[:2, 2]
 
-            return points
+            return PolarSystem.to_polar(points)
 
         raise TypeError(f'Argument should be ndarray, list, or tuple. Type used: {type(obj)}.')
 
 
+    def get_ring_resolution(self, radius, tolerance=.25, max_points=400):
+        """The number of points for a ring of the given radius to stay
+        within `tolerance` pixels of a true circle.
+        """
+
+        pixels = radius * np.max(np.abs(self.scale))
+
+        if pixels <= tolerance:
+            return 32
+
+        segments = np.pi / np.arccos(1 - tolerance / pixels)
+
+        return int(np.clip(np.ceil(segments) + 1, 32, max_points))
+
+
     def get_rings(self, max_radius, grid_config: PolarGridConfig, shape_config: ShapeConfig):
         ring_count = int(max_radius / grid_config.step_r + 1)
 
@@ -122,40 +161,38 @@ class PolarSystem(System):
         primary_config = CurveConfig(width=2, color='#4447')
         secondary_config = CurveConfig(width=1, color='#6664')
 
-        primary_rings = Group()
-        secondary_rings = Group()
+        indices = np.arange(ring_count)
+        theta = np.linspace(0, 2*np.pi, self.get_ring_resolution(max_radius))
 
-        ring_labels = Group()
+        primary_radii = (indices + 1) * grid_config.step_r
+        secondary_radii = (indices + 1/2) * grid_config.step_r
 
-        for i in range(ring_count):
-            primary_radius = (i + 1) * grid_config.step_r
-            secondary_radius = (i + 1/2) * grid_config.step_r
+        for name, radii, config in (
+            ('primary-rings', primary_radii, primary_config),
+            ('secondary-rings', secondary_radii, secondary_config)
+        ):
+            rings = np.empty((ring_count, len(theta), 2))
+            rings[..., 0] = radii[:, None]
+            rings[..., 1] = theta
 
-            primary_ring = self.plot(
-                lambda theta: np.full_like(theta, primary_radius),
-                0, 2*np.pi, render=False, curve_config = primary_config
+            ring_group.add_shape(
+                Curve(join_segments(rings), curve_config=config, shape_config=shape_config),
+                name
             )
-            primary_rings.add_shape(primary_ring, f'primary-ring-{i}')
 
-            secondary_ring = self.plot(
-                lambda theta: np.full_like(theta, secondary_radius),
-                0, 2*np.pi, render=False, curve_config = secondary_config
-            )
-            secondary_rings.add_shape(secondary_ring, f'secondary-ring-{i}')
+        if grid_config.show_radii:
+            points = np.column_stack((primary_radii, np.zeros(ring_count)))
+            points = self.apply_offset(points, grid_config.ring_label_offset)
 
-            if grid_config.show_radii:
+            for i, point in enumerate(points):
                 label_shape = Latex(
-                    str(primary_radius),
-                    self.apply_offset((primary_radius, 0), grid_config.ring_label_offset),
+                    str((i + 1) * grid_config.step_r),
+                    point,
                     latex_config=grid_config.ring_label_config,
                     shape_config=shape_config
                 )
 
-                ring_labels.add_shape(label_shape, f'ring-label-{i}')
-
-        ring_group.merge_with(primary_rings)
-        ring_group.merge_with(secondary_rings)
-        ring_group.merge_with(ring_labels)
+                ring_group.add_shape(label_shape, f'ring-label-{i}')
 
         return ring_group
 
@@ -166,61 +203,45 @@ class PolarSystem(System):
 
         lines_group = Group()
 
-        primary_lines = Group()
-        secondary_lines = Group()
-        line_labels = Group()
-
-        def create_section(theta, config, group, label_config, show_label):
-            line = Curve(
-                [
-                    (0, 0),
-                    (max_radius, theta)
-                ],
-                curve_config = config,
-                shape_config = shape_config
+        primary_section_size = np.pi/2 / grid_config.primary_sections
+        secondary_section_size = primary_section_size / grid_config.secondary_sections
+
+        primary_thetas = np.arange(4 * grid_config.primary_sections) * primary_section_size
+        secondary_thetas = (
+            primary_thetas[:, None]
+            + np.arange(1, grid_config.secondary_sections) * secondary_section_size
+        ).ravel()
+
+        sections = (
+            ('primary', primary_thetas, primary_config, grid_config.primary_label_config, grid_config.show_primary_angles),
+            ('secondary', secondary_thetas, secondary_config, grid_config.secondary_label_config, grid_config.show_secondary_angles)
+        )
+
+        for name, thetas, config, label_config, show_labels in sections:
+            lines = np.zeros((len(thetas), 2, 2))
+            lines[:, 1, 0] = max_radius
+            lines[:, 1, 1] = thetas
+
+            lines_group.add_shape(
+                Curve(join_segments(lines), curve_config=config, shape_config=shape_config),
+                f'{name}-lines'
             )
-            group.add_shape(line)
 
-            if show_label:
+            if not show_labels:
+                continue
+
+            points = np.column_stack((np.full_like(thetas, max_length / 2), thetas))
+            points = self.apply_offset(points, grid_config.line_label_offset)
+
+            for i, (theta, point) in enumerate(zip(thetas, points)):
                 label_shape = Latex(
                     pi_format(theta),
-                    self.apply_offset((max_length / 2, theta), grid_config.line_label_offset),
+                    point,
                     latex_config = label_config,
                     shape_config = shape_config
                 )
-                group.add_shape(label_shape)
-
-        for quadrant in range(4):
-            quadrant_theta = quadrant * np.pi/2
-            quadrant_size = np.pi/2
-            primary_section_size = quadrant_size / grid_config.primary_sections
-            secondary_section_size = primary_section_size / grid_config.secondary_sections
-
-            for primary_section in range(grid_config.primary_sections):
-                primary_theta = quadrant_theta + primary_section*primary_section_size
-
-                create_section(
-                    primary_theta,
-                    primary_config,
-                    primary_lines,
-                    grid_config.primary_label_config,
-                    grid_config.show_primary_angles
-                )
-
-                for secondary_section in range(1, grid_config.secondary_sections):
-                    secondary_theta = primary_theta + secondary_section*secondary_section_size
-
-                    create_section(
-                        secondary_theta,
-                        secondary_config,
-                        secondary_lines,
-                        grid_config.secondary_label_config,
-                        grid_config.show_secondary_angles
-                    )
 
-        lines_group.merge_with(primary_lines)
-        lines_group.merge_with(secondary_lines)
-        lines_group.merge_with(line_labels)
+                lines_group.add_shape(label_shape, f'{name}-line-label-{i}')
 
         return lines_group
 
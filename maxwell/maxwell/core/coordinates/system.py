@@ -26,6 +26,42 @@ class System:
         self.origin = np.array(origin)
 
 
+    def __setattr__(self, key, value):
+        super().__setattr__(key, value)
+
+        if key in ('scale', 'origin'):
+            self.mark_changed()
+
+
+    def mark_changed(self):
+        """Bump the version used to invalidate normalized output. Call
+        after changing `scale` or `origin` in place.
+        """
+
+        self.version = getattr(self, 'version', 0) + 1
+
+
+    def get_affine(self):
+        """The 3x3 affine matrix taking system coordinates to canvas
+        coordinates, and its inverse. Cached until `scale` or `origin`
+        changes.
+        """
+
+        if getattr(self, 'affine', None) is None or self.affine[0] != self.version:
+            scale_x, scale_y = np.broadcast_to(self.scale, 2)
+            origin_x, origin_y = np.broadcast_to(self.origin, 2)
+
+            matrix = np.array([
+                [scale_x, 0, origin_x],
+                [0, -scale_y, origin_y],
+                [0, 0, 1]
+            ], dtype=float)
+
+            self.affine = (self.version, matrix, np.linalg.inv(matrix))
+
+        return self.affine[1:]
+
+
     def set_origin(self, origin=None):
         "Set origin."
 
@@ -1,7 +1,17 @@
 class Frame():
-    def __init__(self, apply_callback=None, setup_callback=None):
+    def __init__(self, apply_callback=None, setup_callback=None, seekable=False):
+        """Arguments:
+        * apply_callback -- Called with the frame and the scene's
+        properties each time the frame is applied.
+        * setup_callback -- Called before the scene's first frame.
+        * seekable (bool) -- Whether the callbacks compute the scene's
+        state from `props.i` alone, rather than from the state left by
+        earlier frames, so that the frame can be applied out of order.
+        """
+
         self.apply_callback = apply_callback
         self.setup_callback = setup_callback
+        self.seekable = seekable
 
         self.scene = None
         self.is_first = False
@@ -15,20 +25,31 @@ class Frame():
         return self.scene.shapes[shape_id].properties
 
 
+    def is_seekable(self):
+        return self.seekable or (self.apply_callback is None and self.setup_callback is None)
+
+
     def apply_frame(self):
         props = self.scene.properties
 
         if props.i == 0:
             self.is_first = True
 
-        if 'easing_function' in props.keys()\
+        if 'easing_function' in props\
            and props.i < len(props.easing_function):
             props.easing_ratio = props.easing_function[props.i]
 
         if props.i == 0 and self.setup_callback is not None:
-            self.setup_callback(self, props)
+            self.scene.prepare(self)
 
         if self.apply_callback is not None:
             self.apply_callback(self, props)
 
         props.i += 1
+
+
+    def apply_at(self, i):
+        "Apply the frame as the scene's `i`th frame."
+
+        self.scene.properties.i = i
+        self.apply_frame()
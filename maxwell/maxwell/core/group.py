@@ -71,6 +71,12 @@ class Group:
             self.shapes[obj.shape_name] = obj
 
 
+    def remove_shape(self, shape_name):
+        "Remove a shape from the group."
+
+        return self.shapes.pop(shape_name, None)
+
+
     def merge_with(self, other_group):
         "Merge with other group."
 
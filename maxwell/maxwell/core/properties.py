@@ -1,14 +1,48 @@
+from base64 import b64encode
 from json import dumps, JSONEncoder
-from numpy import ndarray, isinf
+from numpy import ndarray, generic, isinf, ascontiguousarray, dtype as np_dtype
+
+from maxwell.core.util import simplify_polyline
+
+
+def encode_array(obj, array_dtype):
+    """Encode a numeric array as base64 of its raw little-endian
+    buffer, to be decoded by the renderer into a typed array.
+    """
+
+    array_dtype = np_dtype(array_dtype).newbyteorder('<')
+    data = ascontiguousarray(obj, dtype=array_dtype)
+
+    return {
+        '__ndarray__': b64encode(data.data).decode('ascii'),
+        'dtype': array_dtype.name,
+        'shape': data.shape
+    }
 
 
 class PropertiesEncoder(JSONEncoder):
+    def __init__(self, *args, array_dtype=None, **kwargs):
+        """Arguments:
+        * array_dtype (str) -- 'float32' or 'float64' to send numeric
+        arrays as binary buffers; arrays become nested lists if None
+        """
+
+        super().__init__(*args, **kwargs)
+
+        self.array_dtype = array_dtype
+
+
     def default(self, obj):
         from maxwell.shapes.shape import Shape
         from maxwell.core.scene import Scene
 
         if isinstance(obj, ndarray):
+            if self.array_dtype is not None and obj.ndim > 0 and obj.dtype.kind in 'fiu':
+                return encode_array(obj, self.array_dtype)
+
             return obj.tolist()
+        if isinstance(obj, generic):
+            return obj.item()
         if isinstance(obj, (Shape, Scene)):
             out = {}
 
@@ -24,7 +58,30 @@ class PropertiesEncoder(JSONEncoder):
         return JSONEncoder.default(self, obj)
 
 
+def fingerprint(value):
+    """A copy of a normalized value's contents, cheap enough to compare
+    on every frame, so that in-place changes invalidate cached output.
+    """
+
+    if isinstance(value, ndarray):
+        return value.dtype.str, value.shape, value.tobytes()
+
+    if isinstance(value, (list, tuple)):
+        try:
+            return tuple(map(tuple, value))
+        except TypeError:
+            return tuple(value)
+
+    return value
+
+
 class Properties:
+    """Shape or scene properties. Writes through attributes or items
+    are tracked, so that shapes (see `get_normalized`) can reuse
+    normalized output until a property or the coordinate system
+    changes.
+    """
+
     def __getitem__(self, key):
         return getattr(self, key)
 
@@ -33,22 +90,71 @@ class Properties:
         setattr(self, key, value)
 
 
+    def __setattr__(self, key, value):
+        object.__setattr__(self, key, value)
+
+        if not key.startswith('_'):
+            self.mark_changed()
+
+
+    def __contains__(self, key):
+        return not key.startswith('_') and key in self.__dict__
+
+
     def keys(self):
         return [k for k in self.__dict__ if not k.startswith('_')]
 
 
     def __init__(self, **kwargs):
+        self._version = 0
+        self._normalized = None
+        self._simplified = None
+
         self.normalized_keys = []
 
         for key, value in kwargs.items():
             setattr(self, key, value)
 
 
+    def mark_changed(self):
+        "Invalidate cached output after an untracked (in-place) change."
+
+        self._version += 1
+
+
     def set_normalized(self, *normalized_keys):
         self.normalized_keys = normalized_keys
 
 
-    def get_normalized(self, system):
+    def set_simplified(self, tolerance, *simplified_keys):
+        """Simplify the given normalized point keys in the output, dropping
+        points within `tolerance` pixels of the drawn line. A tolerance
+        of None disables simplification.
+        """
+
+        self._simplified = None if tolerance is None else (tolerance, simplified_keys)
+        self.mark_changed()
+
+
+    def get_normalized(self, system, cached=False):
+        """Properties with the normalized keys in client coordinates.
+
+        Arguments:
+        * cached (bool) -- reuse the previous output until a property is
+        assigned, a normalized value is changed in place, or the system
+        changes. The nested values of the output are shared with the
+        cache and must not be modified.
+        """
+
+        if cached:
+            cache_key = (
+                self._version, system, getattr(system, 'version', None),
+                self.get_fingerprints()
+            )
+
+            if self._normalized is not None and self.matches_cache(cache_key):
+                return dict(self._normalized[1])
+
         normalized = {}
 
         if system is not None:
@@ -60,6 +166,38 @@ class Properties:
                     for key, value in zip(obj, values):
                         normalized[key] = value
                 else:
-                    normalized[obj] = system.normalize(getattr(self, obj)).tolist()
+                    normalized[obj] = system.normalize(getattr(self, obj))
+
+            if self._simplified is not None:
+                tolerance, simplified_keys = self._simplified
+
+                for key in simplified_keys:
+                    if key in normalized:
+                        normalized[key] = simplify_polyline(normalized[key], tolerance)
+
+        result = { **self } | normalized
+
+        if not cached:
+            return result
+
+        self._normalized = (cache_key, result)
+
+        return dict(result)
+
+
+    def get_fingerprints(self):
+        "Fingerprints of the normalized values (see `fingerprint`)."
+
+        return tuple(
+            tuple(fingerprint(getattr(self, key)) for key in obj)
+            if isinstance(obj, (tuple, ndarray, list)) else fingerprint(getattr(self, obj))
+            for obj in self.normalized_keys
+        )
+
 
-        return { **self } | normalized
+    def matches_cache(self, cache_key):
+        try:
+            return self._normalized[0] == cache_key
+        except ValueError:
+            # Fingerprints holding arrays cannot be compared as a whole.
+            return False
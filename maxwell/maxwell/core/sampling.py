@@ -0,0 +1,107 @@
+"Adaptive sampling of functions for plotting."
+
+import numpy as np
+
+from maxwell.core.util import evaluate
+
+
+def screen_error(y_start, y_end, y_mid, scale_y, bounds=None):
+    """Distance, in pixels, between each interval's midpoint sample and
+    the straight segment drawn in its place. Intervals touching a
+    non-finite value have infinite error, unless all three values are
+    non-finite (a gap). Values are clipped to `bounds` (the visible
+    range), so that off-screen detail costs nothing.
+    """
+
+    finite = np.isfinite(y_start), np.isfinite(y_end), np.isfinite(y_mid)
+
+    if bounds is not None:
+        y_start, y_end, y_mid = np.clip((y_start, y_end, y_mid), *bounds)
+
+    error = np.abs(y_mid - (y_start + y_end) / 2) * scale_y
+
+    error[~(finite[0] & finite[1] & finite[2])] = np.inf
+    error[~(finite[0] | finite[1] | finite[2])] = 0
+
+    return error
+
+
+def adaptive_sample(func, start, end, scale, bounds=None, max_points=400, initial_num=32, tolerance=.5, min_width=1e-2, vectorized=None):
+    """
+    Sample a function more densely where a straight segment would be
+    visibly wrong, and split the curve at discontinuities.
+
+    Arguments:
+    * func -- The function.
+    * start -- The start of the domain.
+    * end -- The end of the domain.
+    * scale -- The (x, y) scale of the coordinate system, in pixels per unit.
+    * bounds -- The visible (min, max) range of the function's values.
+    * max_points -- The point budget.
+    * initial_num -- The number of uniform samples refinement starts from.
+    * tolerance -- The acceptable screen-space error, in pixels.
+    * min_width -- The narrowest interval to refine, in pixels. Intervals
+    this narrow that still exceed the tolerance are discontinuities.
+    * vectorized -- Whether the function accepts arrays (see `evaluate`).
+    """
+
+    scale = np.abs(np.broadcast_to(scale, 2)).astype(float)
+
+    if bounds is not None:
+        bounds = min(bounds), max(bounds)
+
+    x_values = np.linspace(start, end, max(min(initial_num, max_points), 2))
+    y_values = evaluate(func, x_values, vectorized).astype(float)
+
+    active = np.ones(len(x_values) - 1, dtype=bool)
+    discontinuous = np.zeros(len(x_values) - 1, dtype=bool)
+
+    while (budget := max_points - len(x_values)) > 0:
+        indices = np.flatnonzero(active)
+
+        if len(indices) == 0:
+            break
+
+        x_mid = (x_values[indices] + x_values[indices + 1]) / 2
+        y_mid = evaluate(func, x_mid, vectorized).astype(float)
+
+        error = screen_error(y_values[indices], y_values[indices + 1], y_mid, scale[1], bounds)
+        width = np.abs(x_values[indices + 1] - x_values[indices]) * scale[0]
+
+        refine = error > tolerance
+
+        # Intervals that cannot be narrowed further without converging
+        # contain a jump.
+        narrow = refine & (width / 2 < min_width)
+        discontinuous[indices[narrow]] = True
+        refine &= ~narrow
+
+        if np.count_nonzero(refine) > budget:
+            threshold = np.sort(error[refine])[-budget]
+            refine &= error >= threshold
+            refine[np.flatnonzero(refine)[budget:]] = False
+
+        active[indices[~refine]] = False
+
+        if not refine.any():
+            break
+
+        positions = indices[refine] + 1
+
+        x_values = np.insert(x_values, positions, x_mid[refine])
+        y_values = np.insert(y_values, positions, y_mid[refine])
+        active = np.insert(active, positions, True)
+        discontinuous = np.insert(discontinuous, positions, False)
+
+    # Break the curve inside each discontinuous interval, unless it
+    # already contains a non-finite point.
+    breaks = np.flatnonzero(
+        discontinuous & np.isfinite(y_values[:-1]) & np.isfinite(y_values[1:])
+    ) + 1
+
+    x_breaks = (x_values[breaks - 1] + x_values[breaks]) / 2
+
+    x_values = np.insert(x_values, breaks, x_breaks)
+    y_values = np.insert(y_values, breaks, np.inf)
+
+    return x_values, y_values
@@ -8,6 +8,7 @@ from maxwell.core.properties import Properties
 from maxwell.core.group import Group
 from maxwell.core.frame import Frame
 from maxwell.core.sequence import Sequence
+from maxwell.core.animation import setup_tweens, apply_tweens
 
 
 class Scene():
@@ -15,14 +16,24 @@ class Scene():
 
     DEFAULT_CLIENT = None
 
-    def __init__(self, client=None, properties={}, camera=None):
+    def __init__(self, client=None, properties={}, camera=None, fps=None):
+        """Arguments:
+        * fps (int) -- the rate the frames were built at, so that they
+        can be resampled to another rate; frames play as they are if
+        None
+        """
+
         self.frames = []
         self.current_frame = -1
 
         self.properties = Properties(i = 0, **properties)
         self.camera = camera
+        self.fps = fps
 
         self.linked_scenes = []
+        self.prepared = False
+        self.seek_indices = []
+        self.seekable = None
 
         self.shapes = {}
         self.background = {}
@@ -42,9 +53,33 @@ class Scene():
         self.frames.append(frame)
 
 
-    def repeat_frame(self, frame_num, apply_callback=None, setup_callback=None):
+    def repeat_frame(self, frame_num, apply_callback=None, setup_callback=None, seekable=False):
         for _ in range(frame_num):
-            self.add_frame(Frame(apply_callback, setup_callback))
+            self.add_frame(Frame(apply_callback, setup_callback, seekable))
+
+
+    def add_tweens(self, frame_num, tweens):
+        "Add `frame_num` frames playing the given tweens together."
+
+        self.properties.tweens = list(tweens)
+        self.repeat_frame(frame_num, apply_tweens, setup_tweens, seekable=True)
+
+
+    def prepare(self, frame=None):
+        """Run the first frame's setup callback, once. Seekable frames
+        are set up before the first one is applied, in whichever order.
+        """
+
+        if self.prepared:
+            return
+
+        self.prepared = True
+
+        if frame is None and self.frames:
+            frame = self.frames[0]
+
+        if frame is not None and frame.setup_callback is not None:
+            frame.setup_callback(frame, self.properties)
 
 
     def extend(self, n):
@@ -91,35 +126,239 @@ class Scene():
         self.linked_scenes.append(other_scene)
 
 
-    def render_frames(self):
-        rendered_frames = []
+    def get_scenes(self):
+        return (self, *self.linked_scenes)
+
+
+    def get_frame_count(self):
+        return max(len(scene.frames) for scene in self.get_scenes())
+
+
+    def get_duration(self, fps=None):
+        "The scene's length in seconds, at its own rate, or else at `fps`."
+
+        return self.get_frame_count() / (self.fps or fps)
+
+
+    def resamples(self, fps):
+        """Whether the scene is resampled when output at `fps`, which
+        requires that its frames play tweens, the only state that can
+        be interpolated between frames.
+        """
+
+        return fps is not None and self.fps is not None and fps != self.fps and self.is_interpolable()
+
+
+    def get_output_count(self, fps=None):
+        "The number of frames output at `fps`."
+
+        if self.resamples(fps):
+            return round(self.get_frame_count() * fps / self.fps)
+
+        return self.get_frame_count()
+
+
+    def get_frame_kinds(self):
+        "Whether every frame is seekable, and whether every frame is a tween frame or empty."
+
+        frame_counts = tuple(len(scene.frames) for scene in self.get_scenes())
+
+        if self.seekable is None or self.seekable[0] != frame_counts:
+            frames = [frame for scene in self.get_scenes() for frame in scene.frames]
+
+            seekable = all(frame.is_seekable() for frame in frames)
+            interpolable = seekable and all(frame.apply_callback in (None, apply_tweens) for frame in frames)
+
+            self.seekable = (frame_counts, seekable, interpolable)
+
+        return self.seekable[1:]
+
+
+    def is_seekable(self):
+        "Whether any frame can be produced without replaying the frames before it."
+
+        return self.get_frame_kinds()[0]
+
+
+    def is_interpolable(self):
+        "Whether the scene's state can be rendered between frames."
+
+        return self.get_frame_kinds()[1]
+
+
+    def get_seek_index(self, k):
+        "The last frame, up to frame `k`, that changes the scene's state."
+
+        if len(self.seek_indices) != len(self.frames):
+            last = -1
+            self.seek_indices = []
+
+            for j, frame in enumerate(self.frames):
+                if frame.apply_callback is not None or frame.setup_callback is not None:
+                    last = j
+
+                self.seek_indices.append(last)
+
+        return self.seek_indices[k]
+
+
+    def seek(self, k):
+        "Apply the state at frame `k` directly, without replaying earlier frames."
+
+        if not self.is_seekable():
+            raise ValueError('Scene is not seekable.')
+
+        for scene in self.get_scenes():
+            if not scene.frames:
+                continue
+
+            scene.prepare()
+
+            j = scene.get_seek_index(min(k, len(scene.frames) - 1))
+
+            if j >= 0:
+                scene.frames[j].apply_at(j)
+
+            scene.properties.i = k + 1
+
+
+    def reset(self):
+        "Restore the state from before the first frame, for tween-backed scenes."
+
+        for scene in reversed(self.get_scenes()):
+            if scene.prepared and 'tweens' in scene.properties:
+                for tween in reversed(scene.properties.tweens):
+                    tween.reset()
+
+
+    def render_shapes(self, shapes, named=False):
+        "Collect the rendered properties of the given shapes."
+
+        frame_set = {}
+
+        if self.camera is not None:
+            self.camera.run_hooks(self)
+
+        for shape in shapes:
+            shape_props = shape.get_props()
+
+            if self.camera is not None:
+                shape_props = self.camera.apply(shape, shape_props)
+
+            key = shape.shape_name
+            duplicates = 1
+
+            while key in frame_set:
+                duplicates += 1
+                key = f'{shape.shape_name}#{duplicates}'
+
+            frame_set[key] = shape_props
+
+        return frame_set if named else list(frame_set.values())
+
+
+    def get_active_shapes(self, k):
+        "The shapes of the scenes that have a frame `k`, without repeats."
+
+        shapes = {}
+
+        for scene in self.get_scenes():
+            if k < len(scene.frames):
+                for shape in scene.shapes.values():
+                    shapes[id(shape)] = shape
+
+        return shapes.values()
+
+
+    def frame_at(self, k, named=False, fps=None):
+        """Render frame `k` in closed form. Requires a seekable scene.
+        With `fps`, `k` counts frames at that rate instead of the scene's.
+        """
+
+        if self.resamples(fps):
+            return self.render_position((k + 1) * self.fps / fps - 1, named)
+
+        self.seek(k)
+
+        return self.render_shapes(self.get_active_shapes(k), named)
+
+
+    def render_position(self, position, named=False):
+        """Render the scene at a fractional frame position. Tweens are
+        interpolated between frames.
+        """
+
+        k = int(np.clip(np.floor(position), 0, self.get_frame_count() - 1))
+
+        self.seek(k)
+
+        if position != k:
+            for scene in self.get_scenes():
+                if 'tweens' in scene.properties:
+                    for tween in scene.properties.tweens:
+                        tween.set_value(tween.value_at(position))
+
+        return self.render_shapes(self.get_active_shapes(k), named)
+
+
+    def evaluate(self, t, named=False):
+        "Render the scene at `t`, from 0 (the first frame) to 1 (the last)."
+
+        return self.render_position(t * (self.get_frame_count() - 1), named)
+
+
+    def frame_at_time(self, time, named=False):
+        "Render the scene `time` seconds after it starts. Requires `fps`."
+
+        return self.render_position(time * self.fps - 1, named)
+
+
+    def iter_frames(self, named=False, start=0, stop=None, fps=None):
+        """Lazily apply each frame and yield the rendered shape properties.
+        Seekable scenes compute each frame in closed form; others replay
+        every frame from the first.
+
+        Arguments:
+        * named (bool) -- whether each frame should be a dict keyed by
+        shape name instead of a list
+        * start (int) -- the first frame to yield
+        * stop (int) -- the frame to stop before; the end if None
+        * fps (int) -- the rate to sample the scene at, if its frames
+        play tweens and it has its own rate
+        """
+
+        if self.is_seekable():
+            if stop is None:
+                stop = self.get_output_count(fps)
+
+            for k in range(start, stop):
+                yield self.frame_at(k, named, fps)
+
+            return
 
         linked_frames = (linked_scene.frames for linked_scene in self.linked_scenes)
 
-        for frames in zip_longest(self.frames, *linked_frames):
-            shape_set = set()
+        for k, frames in enumerate(zip_longest(self.frames, *linked_frames)):
+            if stop is not None and k >= stop:
+                break
+
+            shapes = {}
 
             for frame in frames:
                 if frame is not None:
                     frame.apply_frame()
-                    shape_set |= set(frame.scene.shapes.values())
-
-            frame_set = []
-
-            if self.camera is not None:
-                self.camera.run_hooks(self)
 
-            for shape in shape_set:
-                shape_props = shape.get_props()
+                    for shape in frame.scene.shapes.values():
+                        shapes[id(shape)] = shape
 
-                if self.camera is not None:
-                    shape_props = self.camera.apply(shape, shape_props)
+            if k >= start:
+                yield self.render_shapes(shapes.values(), named)
 
-                frame_set.append(shape_props)
 
-            rendered_frames.append(frame_set)
+    def render_frames(self, named=False):
+        "Apply every frame and collect the rendered shape properties."
 
-        return rendered_frames
+        return list(self.iter_frames(named))
 
 
     def play(self, **kwargs):
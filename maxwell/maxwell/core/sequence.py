@@ -1,10 +1,107 @@
 import os
+import pickle
+import warnings
+import multiprocessing
+
+from itertools import chain, islice, repeat
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 from maxwell.client.message import Message
 from maxwell.core.properties import PropertiesEncoder
 from maxwell.core.group import Group
 
 
+def values_equal(a, b):
+    if a is b:
+        return True
+
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.shape(a) == np.shape(b) and np.array_equal(a, b)
+
+    try:
+        return bool(a == b)
+    except ValueError:
+        return False
+
+
+def encode_deltas(frames, keyframe_interval):
+    """Encode named frames as a full keyframe every `keyframe_interval`
+    frames, followed by patches holding only the changed shapes and keys,
+    the shapes removed, and the keys removed from each remaining shape.
+    Patches also hold the order of the shape names, which is the draw
+    order, whenever it differs from the previous order with removed
+    shapes dropped and added ones appended.
+    """
+
+    previous = None
+
+    for i, frame in enumerate(frames):
+        if previous is None or i % keyframe_interval == 0:
+            yield { 'keyframe': frame }
+        else:
+            changes = {}
+            removed_keys = {}
+
+            for name, props in frame.items():
+                previous_props = previous.get(name)
+
+                if previous_props is None:
+                    changes[name] = props
+                elif previous_props is not props:
+                    changed = {
+                        key: value for key, value in props.items()
+                        if key not in previous_props or not values_equal(previous_props[key], value)
+                    }
+
+                    if changed:
+                        changes[name] = changed
+
+                    missing = [key for key in previous_props if key not in props]
+
+                    if missing:
+                        removed_keys[name] = missing
+
+            delta = { 'delta': changes }
+
+            if removed_keys:
+                delta['removedKeys'] = removed_keys
+
+            removed = [name for name in previous if name not in frame]
+
+            if removed:
+                delta['removed'] = removed
+
+            order = list(frame)
+            kept = [name for name in previous if name in frame]
+
+            if order != kept + [name for name in frame if name not in previous]:
+                delta['order'] = order
+
+            yield delta
+
+        previous = frame
+
+
+# The copy of the sequence held by each worker process.
+WORKER_SEQUENCE = None
+
+
+def load_sequence(data):
+    "Worker initializer: unpickle the sequence once per process."
+
+    global WORKER_SEQUENCE
+
+    WORKER_SEQUENCE = pickle.loads(data)
+
+
+def render_range(start, stop, named, fps):
+    "Worker task: render frames `start` to `stop` of the worker's sequence."
+
+    return list(WORKER_SEQUENCE.iter_frames(named, start, stop, fps))
+
+
 class Sequence:
     def __init__(self, client, scenes=None, fps=100, background=None, camera=None):
         self.client = client
@@ -24,6 +121,8 @@ class Sequence:
 
         self.show_shapes = []
 
+        self.position = 0
+
 
     def add_scene(self, scene):
         if scene.camera is None:
@@ -51,47 +150,277 @@ class Sequence:
 
 
     def wait(self, duration):
-        frame_num = int(duration * self.fps)
-
         if len(self.scenes) > 0:
-            self.scenes[-1].extend(frame_num)
+            scene = self.scenes[-1]
+            scene.extend(int(duration * (scene.fps or self.fps)))
         else:
             from maxwell.core.scene import Scene
 
-            scene = Scene(self.client, {}, self.camera)
+            scene = Scene(self.client, {}, self.camera, fps=self.fps)
 
             for shape in self.show_shapes:
                 scene.add_shape(shape)
 
-            scene.repeat_frame(frame_num)
+            scene.repeat_frame(int(duration * self.fps))
 
             self.scenes.append(scene)
 
 
-    def compile(self, save_path='none', initial_clear=True, clears=True, await_completion=False):
-        save_path = os.path.expanduser(save_path)
+    def get_frame_count(self, fps=None):
+        "The number of frames output at `fps`, or at each scene's own rate if None."
+
+        return sum(scene.get_output_count(fps) for scene in self.scenes)
+
+
+    def get_duration(self):
+        return sum(scene.get_duration(self.fps) for scene in self.scenes)
+
+
+    def is_seekable(self):
+        return all(scene.is_seekable() for scene in self.scenes)
+
+
+    def locate(self, k, fps=None):
+        "The index of the scene holding frame `k`, and the frame's index in it."
+
+        for index, scene in enumerate(self.scenes):
+            frame_count = scene.get_output_count(fps)
+
+            if k < frame_count:
+                return index, k
+
+            k -= frame_count
+
+        raise IndexError('Frame index out of range.')
+
+
+    def frame_at(self, k, named=False, fps=None):
+        """Render frame `k` of the sequence in closed form. Scenes between
+        the last frame rendered and this one are applied at their last
+        frame, or reset when seeking backwards, so that their state
+        carries over. Requires seekable scenes. With `fps`, scenes with
+        their own rate are resampled, and `k` counts frames at `fps`.
+        """
+
+        index, k = self.locate(k, fps)
+
+        if index < self.position:
+            for scene in reversed(self.scenes[index + 1:self.position + 1]):
+                scene.reset()
+        else:
+            for scene in self.scenes[self.position:index]:
+                scene.seek(scene.get_frame_count() - 1)
+
+        self.position = index
+
+        return self.scenes[index].frame_at(k, named, fps)
 
-        rendered_frames = [frame for scene in self.scenes for frame in scene.render_frames()]
+
+    def iter_frames(self, named=False, start=0, stop=None, fps=None):
+        """Lazily render the frames of every scene in order, from frame
+        `start` up to `stop`. Frames before `start` are only replayed if
+        a scene is not seekable. With `fps`, tween-backed scenes with
+        their own rate are sampled at `fps` instead of playing frame by
+        frame.
+        """
+
+        if self.is_seekable():
+            if stop is None:
+                stop = self.get_frame_count(fps)
+
+            for k in range(start, stop):
+                yield self.frame_at(k, named, fps)
+
+            return
+
+        frames = (frame for scene in self.scenes for frame in scene.iter_frames(named, fps=fps))
+
+        yield from islice(frames, start, stop)
+
+
+    def seek_end(self):
+        "Apply the last frame of every scene not yet applied, in order."
+
+        for scene in self.scenes[self.position:]:
+            scene.seek(scene.get_frame_count() - 1)
+
+        self.position = max(len(self.scenes) - 1, 0)
+
+
+    def iter_frames_parallel(self, named=False, fps=None, workers=None, chunk_size=None):
+        """Render frames in `workers` processes, in chunks of `chunk_size`
+        frames, and yield them in order. Each worker receives a pickled
+        copy of the sequence, with its shapes and client, once, and
+        seeks to the start of each chunk it renders. Frames are rendered
+        here instead, with a warning, if a scene is not seekable or
+        cannot be pickled (for example, because a callback is a lambda),
+        if the viewport size cannot be fetched for the workers, or if
+        this is itself a child process.
+
+        Where processes are spawned (Windows, macOS), workers import the
+        main module, so a script must only render under an
+        `if __name__ == '__main__':` guard.
+        """
+
+        if multiprocessing.parent_process() is not None:
+            warnings.warn(
+                'Rendering frames serially in a child process. If this is a '
+                'worker importing the main module, render under an '
+                "`if __name__ == '__main__':` guard.",
+                RuntimeWarning
+            )
+
+            yield from self.iter_frames(named, fps=fps)
+            return
+
+        if not self.is_seekable():
+            warnings.warn('Rendering frames serially, as a scene is not seekable.', RuntimeWarning)
+
+            yield from self.iter_frames(named, fps=fps)
+            return
+
+        clients = {id(client): client for client in (self.client, *(scene.client for scene in self.scenes))}
+
+        try:
+            # Workers cannot ask for the viewport size themselves.
+            for client in clients.values():
+                if hasattr(client, 'ensure_viewport_shape'):
+                    client.ensure_viewport_shape()
+        except ConnectionError as error:
+            warnings.warn(f'Rendering frames serially, as the viewport size is unknown: {error}', RuntimeWarning)
+
+            yield from self.iter_frames(named, fps=fps)
+            return
+
+        try:
+            data = pickle.dumps(self)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            warnings.warn(f'Rendering frames serially, as the sequence cannot be pickled: {error}', RuntimeWarning)
+
+            yield from self.iter_frames(named, fps=fps)
+            return
+
+        frame_count = self.get_frame_count(fps)
+
+        if chunk_size is None:
+            chunk_size = max(-(-frame_count // (4 * (workers or os.cpu_count()))), 1)
+
+        starts = range(0, frame_count, chunk_size)
+        stops = [min(start + chunk_size, frame_count) for start in starts]
+
+        try:
+            with ProcessPoolExecutor(workers, initializer=load_sequence, initargs=(data,)) as executor:
+                for chunk in executor.map(render_range, starts, stops, repeat(named), repeat(fps)):
+                    yield from chunk
+        finally:
+            # Leave the shapes here as rendering in this process would have.
+            self.seek_end()
+
+
+    def iter_rendered_frames(self, initial_clear=True, delta=False, keyframe_interval=None, fps=None, workers=None):
+        """Lazily render and encode the frames of every scene in order, at
+        `fps` (the sequence's rate if None), in `workers` processes if
+        given.
+        """
+
+        if fps is None:
+            fps = self.fps
+
+        if workers is not None:
+            frames = self.iter_frames_parallel(delta, fps, workers)
+        else:
+            frames = self.iter_frames(delta, fps=fps)
+
+        if delta:
+            if keyframe_interval is None:
+                keyframe_interval = fps
+
+            if keyframe_interval < 1:
+                raise ValueError('keyframe_interval must be a positive integer')
+
+            frames = encode_deltas(frames, keyframe_interval)
 
         if initial_clear:
-            rendered_frames = [[]] + rendered_frames
+            frames = chain([[]], frames)
+
+        return frames
+
+
+    def scene_args(self, save_path, clears, await_completion, delta, fps=None):
+        if fps is None:
+            fps = self.fps
+
+        return {
+            'background': list(self.background.shapes.values()),
+            'frameDuration': 1/fps,
+            'savePath': os.path.expanduser(save_path),
+            'framerate': fps,
+            'fps': fps,
+            'clears': clears,
+            'awaitsCompletion': await_completion,
+            'encoding': 'delta' if delta else 'full'
+        }
+
+
+    def compile(self, save_path='none', initial_clear=True, clears=True, await_completion=False, delta=False, keyframe_interval=None, fps=None, workers=None):
+        """Render all scenes into a renderScene message.
+
+        Arguments:
+        * delta (bool) -- send periodic keyframes followed by patches of
+        the changed shapes instead of every shape in every frame
+        * keyframe_interval (int) -- frames between keyframes, at least
+        one; defaults to one second of frames
+        * fps (int) -- the output rate; defaults to the sequence's.
+        Seekable scenes are sampled in time at this rate, whatever rate
+        they were built at, so the same sequence can be previewed at a
+        low rate and exported at a high one.
+        * workers (int) -- the number of processes to render frames in
+        (see `iter_frames_parallel`); frames are rendered here if None
+        """
+
+        rendered_frames = list(self.iter_rendered_frames(initial_clear, delta, keyframe_interval, fps, workers))
 
         message = Message(
             self.client, 'renderScene',
-            encoder          = PropertiesEncoder,
-            frames           = rendered_frames,
-            background       = list(self.background.shapes.values()),
-            frameDuration    = 1/self.fps,
-            savePath         = save_path,
-            framerate        = self.fps,
-            fps              = self.fps,
-            clears           = clears,
-            awaitsCompletion = await_completion,
+            encoder = PropertiesEncoder,
+            frames  = rendered_frames,
+            args    = self.scene_args(save_path, clears, await_completion, delta, fps)
         )
 
         return message
 
 
-    def run(self, **kwargs):
-        message = self.compile(**kwargs)
+    def stream(self, chunk_size=100, save_path='none', initial_clear=True, clears=True, await_completion=False, delta=False, keyframe_interval=None, fps=None, workers=None):
+        """Send frames in chunks of `chunk_size` while the rest are still
+        being rendered. Playback starts once the first chunk arrives.
+        """
+
+        frames = self.iter_rendered_frames(initial_clear, delta, keyframe_interval, fps, workers)
+
+        message = Message(
+            self.client, 'renderScene',
+            encoder   = PropertiesEncoder,
+            frames    = list(islice(frames, chunk_size)),
+            streaming = True,
+            args      = self.scene_args(save_path, clears, await_completion, delta, fps)
+        )
         message.send()
+
+        while chunk := list(islice(frames, chunk_size)):
+            message = Message(
+                self.client, 'appendFrames',
+                encoder = PropertiesEncoder,
+                frames  = chunk
+            )
+            message.send()
+
+        message = Message(self.client, 'appendFrames', frames=[], done=True)
+        message.send()
+
+
+    def run(self, stream=False, **kwargs):
+        if stream:
+            self.stream(**kwargs)
+        else:
+            message = self.compile(**kwargs)
+            message.send()
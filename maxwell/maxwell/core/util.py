@@ -131,6 +131,7 @@ def resize_window(client, width=600, height=500, rerender=True, system=None):
         }
     }
 
+    client.viewport_shape = None
     client.send_message(message)
 
     client.receive_message()
@@ -176,6 +177,179 @@ def rotate(points, origin, theta, degrees=False):
     return (points - origin).dot(R.T) + origin
 
 
+def matches_scalar_calls(func, result, *inputs):
+    """
+    Check a broadcasted result against scalar calls of the function at
+    the first and last inputs, so that a reduction over the whole
+    array (e.g. `np.sum`) isn't mistaken for a constant.
+
+    Arguments:
+    * func -- The function.
+    * result -- The result, broadcasted to the shape of the inputs.
+    * inputs -- The arrays of arguments, broadcastable to that shape.
+    """
+
+    inputs = np.broadcast_arrays(*inputs)
+
+    for index in {0, result.size - 1} if result.size else ():
+        position = np.unravel_index(index, result.shape)
+
+        try:
+            value = np.asarray(func(*(array[position] for array in inputs)))
+        except Exception:
+            return False
+
+        if value.shape != () or value.dtype == object:
+            return False
+
+        if not np.allclose(value, result[position], equal_nan=True):
+            return False
+
+    return True
+
+
+def evaluate(func, values, vectorized=None):
+    """
+    Evaluate a function over an array of values.
+
+    Arguments:
+    * func -- The function.
+    * values -- The array of inputs.
+    * vectorized -- Whether the function accepts arrays (ufuncs, NumPy
+    expressions, composables built from them). If None, one call with
+    the whole array decides, falling back to `np.vectorize` for
+    scalar-only functions. A single value is only broadcasted if
+    scalar calls agree with it, as for a constant function.
+    """
+
+    values = np.asarray(values)
+
+    if vectorized is False:
+        return np.vectorize(func)(values)
+
+    try:
+        result = np.asarray(func(values))
+    except Exception:
+        if vectorized:
+            raise
+
+        return np.vectorize(func)(values)
+
+    if result.shape == values.shape and result.dtype != object:
+        return result
+
+    if result.ndim == 0 and result.dtype != object:
+        result = np.full(values.shape, result)
+
+        if matches_scalar_calls(func, result, values):
+            return result
+
+    if vectorized:
+        raise ValueError(f'Function returned shape {result.shape} for input of shape {values.shape}.')
+
+    return np.vectorize(func)(values)
+
+
+def evaluate_grid(func, x_values, t_values, vectorized=None):
+    """
+    Evaluate a function of two variables, `func(x, t)`, over every
+    combination of values, as a (len(t_values), len(x_values)) array.
+
+    Arguments:
+    * func -- The function.
+    * x_values -- The first arguments (columns).
+    * t_values -- The second arguments (rows).
+    * vectorized -- Whether the function broadcasts over arrays. If
+    None, one broadcasted call decides, falling back to `np.vectorize`.
+    A result that has to be broadcasted (e.g. one that ignores `t`) is
+    checked against scalar calls, as in `evaluate`.
+    """
+
+    x_grid = np.asarray(x_values)[np.newaxis, :]
+    t_grid = np.asarray(t_values)[:, np.newaxis]
+
+    shape = (t_grid.shape[0], x_grid.shape[1])
+
+    if vectorized is not False:
+        try:
+            result = np.asarray(func(x_grid, t_grid))
+        except Exception:
+            if vectorized:
+                raise
+
+            result = None
+
+        if result is not None and result.dtype != object:
+            if result.shape == shape:
+                return result
+
+            try:
+                result = np.broadcast_to(result, shape).copy()
+            except ValueError:
+                pass
+            else:
+                if matches_scalar_calls(func, result, x_grid, t_grid):
+                    return result
+
+        if vectorized:
+            raise ValueError(f'Function did not return numeric values of shape {shape}.')
+
+    return np.vectorize(func)(x_grid, t_grid)
+
+
+def simplify_polyline(points, tolerance):
+    """
+    Drop points that lie within a tolerance of the line through their
+    neighbours (Ramer-Douglas-Peucker). Non-finite points, which break
+    a curve, are kept, and each run between them is simplified on its
+    own.
+
+    Arguments:
+    * points -- The (N, 2) points.
+    * tolerance -- The largest allowed deviation.
+    """
+
+    points = np.asarray(points, dtype=float)
+
+    if len(points) < 3 or points.ndim != 2:
+        return points
+
+    finite = np.isfinite(points).all(axis=1)
+    keep = ~finite
+
+    runs = np.flatnonzero(np.diff(np.concatenate(([0], finite.astype(np.int8), [0]))))
+
+    for run_start, run_end in runs.reshape(-1, 2):
+        keep[run_start] = keep[run_end - 1] = True
+        stack = [(run_start, run_end - 1)]
+
+        while stack:
+            first, last = stack.pop()
+
+            if last - first < 2:
+                continue
+
+            offsets = points[first + 1:last] - points[first]
+            direction = points[last] - points[first]
+            length = np.hypot(*direction)
+
+            if length == 0:
+                distances = np.hypot(offsets[:, 0], offsets[:, 1])
+            else:
+                distances = np.abs(direction[0] * offsets[:, 1] - direction[1] * offsets[:, 0]) / length
+
+            i = np.argmax(distances)
+
+            if distances[i] > tolerance:
+                split = first + 1 + i
+                keep[split] = True
+
+                stack.append((first, split))
+                stack.append((split, last))
+
+    return points[keep]
+
+
 def track_clicks(client, f, system=None):
     while not (props := await_click(client, 'altKey'))[2]:
         point = props[:2]
@@ -269,6 +443,12 @@ def check_type_name(obj, types):
     return any(candidate.__name__ in types for candidate in type(obj).__mro__)
 
 
+def default_formatter(x):
+    if np.isclose(x, int(x)):
+        return str(int(x))
+    return '{:.2f}'.format(x)
+
+
 def pi_format(x):
     if x == 0:
         return '0'
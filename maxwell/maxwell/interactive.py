@@ -27,15 +27,16 @@ from maxwell.shapes.table import Table
 
 from maxwell.html.html_element import HTMLElement
 
-from maxwell.core.animation import AnimationConfig, create_easing_function, animate
+from maxwell.core.animation import AnimationConfig, create_easing_function, animate, EASINGS
 
-from maxwell.client.client import Client
+from maxwell.client.client import Client, AsyncClient
 
 from maxwell.core.sequence import Sequence
 from maxwell.core.scene import Scene
 from maxwell.core.frame import Frame
 from maxwell.core.group import Group
 from maxwell.core.camera import Camera
+from maxwell.core.cache import PLOT_CACHE
 
 from maxwell.core.coordinates.cartesian.system import CartesianSystem, CartesianGridConfig, TRIG, FRACTION
 from maxwell.core.coordinates.polar.system import PolarSystem, PolarGridConfig
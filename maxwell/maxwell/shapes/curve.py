@@ -6,9 +6,9 @@ import numpy as np
 
 from maxwell.shapes.shape import Shape, ShapeConfig
 
-from maxwell.core.animation import AnimationConfig
+from maxwell.core.animation import AnimationConfig, Tween, Rotation
 from maxwell.core.properties import Properties
-from maxwell.core.util import rotate
+from maxwell.core.util import rotate, hex_to_rgb
 from maxwell.core.group import Group
 
 
@@ -21,6 +21,7 @@ class CurveConfig:
     clip: np.typing.ArrayLike = (-1, -1)
     fill_color: str = 'transparent'
     dashed: bool = False
+    simplify: float = None
 
 
 class Curve(Shape):
@@ -52,9 +53,14 @@ class Curve(Shape):
         else:
             arrow_head = []
 
+        if isinstance(points, np.ndarray):
+            points = points.tolist()
+        else:
+            points = list(map(list, list(points)))
+
         self.properties = Properties(
             type = 'curve',
-            points = list(map(list, list(points))),
+            points = points,
             color = curve_config.color,
             width = curve_config.width,
             arrowHead = arrow_head,
@@ -64,6 +70,9 @@ class Curve(Shape):
         )
         self.properties.set_normalized('points', 'arrowHead', 'clip')
 
+        if curve_config.simplify is not None:
+            self.properties.set_simplified(curve_config.simplify, 'points')
+
         if self.auto_render:
             self.render()
 
@@ -100,51 +109,33 @@ class Curve(Shape):
 
 
     @staticmethod
-    def move_point_setup(frame, props):
-        "Frame setup for `move_point`."
-
-        props.cx = props.ending_point[0] - props.point[0]
-        props.cy = props.ending_point[1] - props.point[1]
-
-
-    @staticmethod
-    def move_point_apply(frame, props):
-        "Frame callback for `move_point`."
-
-        x_change = props.cx * props.easing_ratio
-        y_change = props.cy * props.easing_ratio
-
-        props.point[0] += x_change
-        props.point[1] += y_change
-
-        shape = frame.scene.shapes[props.shape_name]
+    def update_arrow_head(shape):
+        "Recompute the arrow head after the last points have moved."
 
         if shape.arrow:
-            frame.props(props.shape_name).arrowHead = shape.compute_arrow_head(
+            shape.properties.arrowHead = shape.compute_arrow_head(
                 shape.properties.points[-2],
                 shape.properties.points[-1]
             )
 
 
-    def move_point(self, point_i, ending_point, animation_config: AnimationConfig = None):
-        "Create a scene moving a specific point."
+    def get_points_tween(self, tween_class, *args, **kwargs):
+        """A tween of the curve's points that keeps them in a list if
+        they are one, and updates the arrow head.
+        """
 
-        scene_properties = {
-            'cx': None,
-            'cy': None,
-            'point': self.properties.points[point_i],
-            'ending_point': ending_point
-        }
+        if isinstance(self.properties.points, list):
+            kwargs['from_array'] = np.ndarray.tolist
 
-        scene, frame_num = self.create_scene(scene_properties, animation_config)
+        return tween_class(self, 'points', *args, on_update=Curve.update_arrow_head, **kwargs)
 
-        scene.repeat_frame(
-            frame_num,
-            Curve.move_point_apply,
-            Curve.move_point_setup
-        )
 
-        return scene
+    def move_point(self, point_i, ending_point, animation_config: AnimationConfig = None):
+        "Create a scene moving a specific point."
+
+        tween = self.get_points_tween(Tween, ending_point, index=point_i)
+
+        return self.create_tween_scene([tween], animation_config)
 
     def move_end(self, point, *args, **kwargs):
         "Create a scene moving the last point."
@@ -152,19 +143,6 @@ class Curve(Shape):
         return self.move_point(len(self.properties.points) - 1, point, *args, **kwargs)
 
 
-    @staticmethod
-    def rotate_about_apply(frame, props):
-        "Frame callback for rotate_about."
-
-        shape_name = props.shape_name
-
-        frame.props(shape_name).points = rotate(
-            frame.props(shape_name).points,
-            props.origin,
-            props.angle * props.easing_ratio
-        )
-
-
     def rotate_about(self, origin, theta, animate=False, animation_config: AnimationConfig = None):
         "Create a scene moving the curve about a specific point."
 
@@ -173,88 +151,28 @@ class Curve(Shape):
 
             return self
 
-        scene_properties = {
-            'origin': origin,
-            'angle': theta
-        }
+        tween = self.get_points_tween(Rotation, origin, theta)
 
-        scene, frame_num = self.create_scene(scene_properties, animation_config)
-
-        scene.repeat_frame(
-            frame_num,
-            Curve.rotate_about_apply
-        )
-
-        return scene
-
-
-    @staticmethod
-    def transform_setup(frame, props):
-        "Callback for transformation frames setup."
-
-        for j, point in enumerate(props.points):
-            target_x, target_y = props.target_curve[j]
-
-            props.cx.append(target_x - point[0])
-            props.cy.append(target_y - point[1])
-
-
-    @staticmethod
-    def transform_apply(frame, props):
-        "Callback for transformation frames."
-
-        for j, point in enumerate(props.points):
-            ratio = props.easing_ratio
-
-            x_change = props.cx[j] * ratio
-            y_change = props.cy[j] * ratio
-
-            props.points[j][0] += x_change
-            props.points[j][1] += y_change
-
-        shape = frame.scene.shapes[props.shape_name]
-
-        if shape.arrow:
-            frame.props(props.shape_name).arrowHead = shape.compute_arrow_head(
-                props.points[-2],
-                props.points[-1]
-            )
+        return self.create_tween_scene([tween], animation_config)
 
 
     def transform(self, target_curve, animation_config: AnimationConfig = None):
         "Create a scene transforming the curve into another one."
 
-        color_scene = None
+        tweens = []
 
         if isinstance(target_curve, Curve):
-            color_scene = self.change_color(
-                target_curve.properties.color,
-                animation_config = animation_config
-            )
+            tweens.append(self.get_color_tween(hex_to_rgb(target_curve.properties.color)))
             target_curve = target_curve.properties.points
 
         target_curve = list(target_curve)
 
-        scene_properties = {
-            'cx': [],
-            'cy': [],
-            'points': self.properties.points,
-            'target_curve': target_curve,
-            'shape_name': self.shape_name
-        }
-
-        scene, frame_num = self.create_scene(
-            scene_properties,
-            animation_config
-        )
-
-        scene.repeat_frame(
-            frame_num,
-            Curve.transform_apply,
-            Curve.transform_setup
-        )
+        if len(target_curve) != len(self.properties.points):
+            raise ValueError(
+                f'Cannot transform a curve of {len(self.properties.points)} points '
+                f'into one of {len(target_curve)} points.'
+            )
 
-        if color_scene is not None:
-            scene.link_scene(color_scene)
+        tweens.append(self.get_points_tween(Tween, target_curve))
 
-        return scene
+        return self.create_tween_scene(tweens, animation_config)
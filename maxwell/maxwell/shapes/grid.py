@@ -0,0 +1,122 @@
+"A compound shape for cartesian grids."
+
+import numpy as np
+
+from maxwell.shapes.shape import Shape, ShapeConfig
+from maxwell.core.properties import Properties
+from maxwell.core.util import default_formatter
+
+
+def latex_args(latex_config):
+    return {
+        'type': 'latex',
+        'fontSize': latex_config.font_size,
+        'color': latex_config.color,
+        'align': latex_config.align,
+        'embed': False
+    }
+
+
+class Grid(Shape):
+    """A cartesian grid drawn as a single shape. The renderer generates
+    the grid lines from the system's origin, scale and steps; labels are
+    computed here for the visible range only.
+    """
+
+    def __init__(self, grid_config, axis_color='#474747', shape_config: ShapeConfig = None):
+        """Arguments:
+        * grid_config (CartesianGridConfig) -- steps, colors, and labels
+        * axis_color (str) -- the color of the axes, if shown
+        """
+
+        super().__init__(shape_config)
+
+        self.x_label_format = grid_config.x_label_format or default_formatter
+        self.y_label_format = grid_config.y_label_format or default_formatter
+
+        self.x_label_offset = np.array(grid_config.x_label_offset, dtype=float)
+        self.y_label_offset = np.array(grid_config.y_label_offset, dtype=float)
+
+        self.x_label_config = grid_config.x_label_config
+        self.y_label_config = grid_config.y_label_config
+
+        self.cache = None
+
+        self.properties = Properties(
+            type = 'grid',
+            step = [grid_config.step_x, grid_config.step_y],
+            showAxes = grid_config.show_axes,
+            showNumbers = grid_config.show_numbers,
+            primaryColor = grid_config.primary_color,
+            secondaryColor = grid_config.secondary_color,
+            axisColor = axis_color,
+            primaryWidth = 2,
+            secondaryWidth = 1,
+            axisWidth = 2
+        )
+
+        if self.auto_render:
+            self.render()
+
+
+    def get_labels(self, origin, scale, edges):
+        "Labels for the grid lines within the visible edges."
+
+        labels = []
+
+        axes = (
+            (0, self.x_label_format, self.x_label_offset, self.x_label_config),
+            (1, self.y_label_format, self.y_label_offset, self.y_label_config)
+        )
+
+        for axis, label_format, offset, latex_config in axes:
+            step = self.properties.step[axis]
+            low, high = sorted(edges[axis])
+
+            indices = np.arange(np.ceil(low / step), np.floor(high / step) + 1)
+            indices = indices[indices != 0]
+
+            values = indices * step
+
+            points = np.tile(origin + offset * (1, -1), (len(values), 1))
+            points[:, axis] += values * scale[axis] * (1, -1)[axis]
+
+            base = latex_args(latex_config)
+
+            for value, point in zip(values, points.tolist()):
+                labels.append(base | {
+                    'source': label_format(value),
+                    'point': point
+                })
+
+        return labels
+
+
+    def get_props(self):
+        "Extract shape rendering properties."
+
+        for access_hook, args in self.access_hooks:
+            access_hook(self, *args)
+
+        width, height = self.client.get_shape()
+
+        cache_key = (self.properties._version, self.system, self.system.version, width, height)
+
+        if self.cache is not None and self.cache[0] == cache_key:
+            return self.cache[1]
+
+        origin = np.broadcast_to(self.system.origin, 2).astype(float)
+        scale = np.broadcast_to(self.system.scale, 2).astype(float)
+
+        left, top = self.system.from_normalized((0, 0))
+        right, bottom = self.system.from_normalized((width, height))
+
+        result = self.properties.get_normalized(None) | {
+            'origin': origin.tolist(),
+            'scale': scale.tolist(),
+            'labels': self.get_labels(origin, scale, ((left, right), (bottom, top))) if self.properties.showNumbers else []
+        }
+
+        self.cache = (cache_key, result)
+
+        return result
@@ -8,7 +8,7 @@ from maxwell.client.message import Message
 from maxwell.core.scene import Scene
 
 from maxwell.core.util import await_click
-from maxwell.core.animation import create_easing_function, AnimationConfig
+from maxwell.core.animation import get_easing, AnimationConfig, Tween
 from maxwell.core.util import rgb_to_hex, hex_to_rgb
 
 
@@ -20,6 +20,7 @@ class ShapeConfig:
     shape_name: str = None
     render: bool = False
     canvas: str = 'default'
+    cached: bool = True
 
 
 class Shape:
@@ -62,6 +63,10 @@ class Shape:
 
         self.canvas = shape_config.canvas
 
+        # Whether normalized properties are reused until a property or
+        # the system changes (see `Properties.get_normalized`).
+        self.cached = shape_config.cached
+
         self.access_hooks = []
 
 
@@ -110,7 +115,7 @@ class Shape:
         for access_hook, args in self.access_hooks:
             access_hook(self, *args)
 
-        return self.properties.get_normalized(self.system)
+        return self.properties.get_normalized(self.system, self.cached)
 
 
     def create_scene(self, properties, animation_config: AnimationConfig = None):
@@ -119,15 +124,13 @@ class Shape:
 
         frame_num = int(animation_config.duration * animation_config.fps)
 
-        easing_function = create_easing_function(
-            frame_num,
-            *animation_config.easing_function
-        )
+        easing_function, easing_progress = get_easing(frame_num, animation_config.easing_function)
 
         properties['easing_function'] = easing_function
+        properties['easing_progress'] = easing_progress
         properties['shape_name'] = self.shape_name
 
-        scene = Scene(self.client, properties)
+        scene = Scene(self.client, properties, fps=animation_config.fps)
 
         scene.add_shape(self)
 
@@ -137,29 +140,14 @@ class Shape:
         return scene, frame_num
 
 
-    @staticmethod
-    def change_color_setup(frame, props):
-        "Setup for change_color frames."
-
-        original_color = frame.props(props.shape_name).color
-        original_color = hex_to_rgb(original_color)
-
-        props.shape_color = original_color
-        props.total_change = props.target_color - props.shape_color
-
+    def create_tween_scene(self, tweens, animation_config: AnimationConfig = None):
+        "Create a scene playing the given tweens together."
 
-    @staticmethod
-    def change_color_apply(frame, props):
-        "Callback for change_color frames."
+        scene, frame_num = self.create_scene({}, animation_config)
 
-        shape = frame.props(props.shape_name)
+        scene.add_tweens(frame_num, tweens)
 
-        color_change = props.easing_ratio * props.total_change
-        color = props.shape_color + color_change
-
-        props.shape_color = color
-
-        shape.color = rgb_to_hex(props.shape_color)
+        return scene
 
 
     def change_color(self, target_color, rgb=False, animation_config: AnimationConfig = None):
@@ -168,15 +156,17 @@ class Shape:
         if not rgb:
             target_color = hex_to_rgb(target_color)
 
-        scene_properties = {
-            'target_color': target_color
-        }
+        return self.create_tween_scene([self.get_color_tween(target_color)], animation_config)
 
-        scene, frame_num = self.create_scene(scene_properties, animation_config)
 
-        scene.repeat_frame(frame_num, Shape.change_color_apply, Shape.change_color_setup)
+    def get_color_tween(self, target_color):
+        "A tween from the current color to an RGBA target color."
 
-        return scene
+        return Tween(
+            self, 'color', target_color,
+            to_array=hex_to_rgb,
+            from_array=rgb_to_hex
+        )
 
 
     def set_opacity(self, opacity):
@@ -206,37 +196,10 @@ class Shape:
         return self.change_color(color, True, animation_config)
 
 
-    @staticmethod
-    def move_to_point_setup(frame, props):
-        "Setup for move_to_point frames."
-
-        props.cx = props.final_x - frame.props(props.shape_name).point[0]
-        props.cy = props.final_y - frame.props(props.shape_name).point[1]
-
-
-    @staticmethod
-    def move_to_point_apply(frame, props):
-        "Callback for move_to_point frames."
-
-        frame.props(props.shape_name).point[0] += props.cx * props.easing_ratio
-        frame.props(props.shape_name).point[1] += props.cy * props.easing_ratio
-
-
     def move_to_point(self, point, animation_config: AnimationConfig = None):
-        scene_properties = {
-            'cx': None,
-            'cy': None,
-            'final_x': point[0],
-            'final_y': point[1]
-        }
-
-        scene, frame_num = self.create_scene(scene_properties,
-                                             animation_config)
+        tween = Tween(self, 'point', point)
 
-        scene.repeat_frame(frame_num, Shape.move_to_point_apply,
-                           Shape.move_to_point_setup)
-
-        return scene
+        return self.create_tween_scene([tween], animation_config)
 
 
     def move_to(self, other_shape, animation_config: AnimationConfig = None):
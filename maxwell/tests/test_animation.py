@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from maxwell.core.animation import create_easing_function, get_easing
+
+
+def test_create_easing_function_is_writable():
+    increments = create_easing_function(10)
+
+    increments[0] = 0
+
+    assert np.isclose(create_easing_function(10).sum(), 1)
+
+
+def test_get_easing_accepts_unhashable_arguments():
+    increments, progress = get_easing(10, [np.sin, 0, np.array(np.pi)])
+
+    assert np.array_equal(increments, get_easing(10, (np.sin,))[0])
+    assert np.isclose(progress[-1], 1)
+
+    assert np.array_equal(get_easing(10, ['quad'])[0], get_easing(10, 'quad')[0])
+
+
+def test_get_easing_rejects_invalid_easings():
+    with pytest.raises(TypeError):
+        get_easing(10, 1)
+
+    with pytest.raises(ValueError):
+        get_easing(10, 'unknown')
@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import pytest
+
+from maxwell.client.client import AsyncClient
+
+
+def run_with_server(handler, test):
+    "Run `test(client)` against a local server that calls `handler`."
+
+    async def main():
+        server = await asyncio.start_server(handler, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+
+        async with server:
+            client = await AsyncClient(port=port).connect()
+
+            try:
+                return await asyncio.wait_for(test(client), 5)
+            finally:
+                client.writer.close()
+
+    return asyncio.run(main())
+
+
+def test_replies_resolve_matching_requests():
+    async def handler(reader, writer):
+        await reader.readline()
+
+        requests = [json.loads(await reader.readline()) for _ in range(2)]
+
+        # Reply out of order.
+        for request in reversed(requests):
+            reply = {'id': request['id'], 'result': request['args']['value']}
+            writer.write((json.dumps(reply) + '\n').encode('utf-8'))
+
+        await writer.drain()
+        await reader.read()
+
+    async def test(client):
+        return await asyncio.gather(
+            client.request('echo', value='a'),
+            client.request('echo', value='b')
+        )
+
+    assert run_with_server(handler, test) == ['a', 'b']
+
+
+def test_listener_failure_fails_pending_requests():
+    async def handler(reader, writer):
+        await reader.readline()
+        await reader.readline()
+
+        writer.write(b'not json\n')
+        await writer.drain()
+        await reader.read()
+
+    async def test(client):
+        with pytest.raises(ConnectionError):
+            await client.request('echo', value='a')
+
+        assert isinstance(client.error, json.JSONDecodeError)
+
+        # Later requests fail at once instead of waiting forever.
+        with pytest.raises(ConnectionError):
+            await client.request('echo', value='b')
+
+        with pytest.raises(ConnectionError):
+            await client.receive_message()
+
+    run_with_server(handler, test)
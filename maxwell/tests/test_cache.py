@@ -0,0 +1,52 @@
+import numpy as np
+
+from maxwell.core.cache import function_key
+
+
+SCALE = 2
+
+
+def scaled(x):
+    return SCALE * x
+
+
+def nested(x):
+    def inner(y):
+        return SCALE * y
+
+    return inner(x)
+
+
+def test_function_key_is_stable():
+    assert function_key(scaled) == function_key(scaled)
+    assert function_key(scaled) != function_key(nested)
+
+
+def test_function_key_follows_globals():
+    global SCALE
+
+    keys = (function_key(scaled), function_key(nested), function_key(lambda x: (lambda: SCALE * x)()))
+
+    SCALE = 3
+
+    try:
+        new_keys = (function_key(scaled), function_key(nested), function_key(lambda x: (lambda: SCALE * x)()))
+    finally:
+        SCALE = 2
+
+    assert all(key != new_key for key, new_key in zip(keys, new_keys))
+
+
+def test_function_key_follows_closures_and_defaults():
+    def make(a):
+        return lambda x, b=1: a * x + b
+
+    assert function_key(make(1)) == function_key(make(1))
+    assert function_key(make(1)) != function_key(make(2))
+
+
+def test_function_key_rejects_mutable_dependencies():
+    values = {'a': 1}
+
+    assert function_key(lambda x: values['a'] * x) is None
+    assert function_key(np.sin) is not None
@@ -0,0 +1,30 @@
+import pickle
+import socket
+
+import numpy as np
+
+from maxwell.client.client import Client
+
+
+def test_pickled_client_is_detached_without_io():
+    server = socket.create_server(('127.0.0.1', 0))
+    client = Client(port=server.getsockname()[1])
+    connection, _ = server.accept()
+
+    try:
+        client.viewport_shape = np.array([640, 480])
+        socket_before = client.socket
+
+        copy = pickle.loads(pickle.dumps(client))
+
+        assert copy.socket is None
+        assert np.array_equal(copy.get_shape(), [640, 480])
+
+        # Pickling neither replaces nor shares the original's state.
+        assert client.socket is socket_before
+        copy.viewport_shape[0] = 0
+        assert np.array_equal(client.viewport_shape, [640, 480])
+    finally:
+        client.close()
+        connection.close()
+        server.close()
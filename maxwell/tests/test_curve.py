@@ -0,0 +1,44 @@
+import pytest
+
+from maxwell.core.animation import AnimationConfig
+from maxwell.shapes.curve import Curve
+
+
+ANIMATION_CONFIG = AnimationConfig(duration=0.1, fps=50)
+
+
+def test_transform_keeps_points_a_list(system):
+    curve = Curve([(0, 0), (1, 1)])
+    scene = curve.transform([(0, 1), (1, 2)], animation_config=ANIMATION_CONFIG)
+
+    for k in range(scene.get_frame_count()):
+        scene.frame_at(k)
+
+        assert isinstance(curve.properties.points, list)
+        assert all(isinstance(point, list) for point in curve.properties.points)
+
+    assert curve.properties.points == [[0, 1], [1, 2]]
+
+
+def test_move_point_keeps_points_a_list(system):
+    curve = Curve([(0, 0), (1, 1)])
+    scene = curve.move_point(1, (2, 3), animation_config=ANIMATION_CONFIG)
+
+    scene.frame_at(scene.get_frame_count() - 1)
+
+    assert curve.properties.points == [[0, 0], [2, 3]]
+
+
+def test_transform_to_different_point_count_raises(system):
+    curve = Curve([(0, 0), (1, 1)])
+
+    with pytest.raises(ValueError):
+        curve.transform([(0, 0), (1, 1), (2, 2)], animation_config=ANIMATION_CONFIG)
+
+
+def test_move_point_to_invalid_point_raises(system):
+    curve = Curve([(0, 0), (1, 1)])
+    scene = curve.move_point(1, (2, 3, 4), animation_config=ANIMATION_CONFIG)
+
+    with pytest.raises(ValueError):
+        scene.frame_at(0)
@@ -0,0 +1,76 @@
+import pytest
+
+from maxwell.core.sequence import Sequence, encode_deltas
+
+
+def decode(encoded):
+    "Rebuild frames from their encoding, as the renderer's FrameDecoder does."
+
+    shapes = {}
+
+    for frame in encoded:
+        if 'keyframe' in frame:
+            shapes = dict(frame['keyframe'])
+        else:
+            for name in frame.get('removed', []):
+                del shapes[name]
+
+            for name, changes in frame['delta'].items():
+                shapes[name] = shapes.get(name, {}) | changes
+
+            for name, keys in frame.get('removedKeys', {}).items():
+                shapes[name] = {key: value for key, value in shapes[name].items() if key not in keys}
+
+            if 'order' in frame:
+                shapes = {name: shapes[name] for name in frame['order']}
+
+        yield dict(shapes)
+
+
+FRAMES = [
+    {'a': {'x': 1, 'y': 2}, 'b': {'x': 0}},
+    {'a': {'x': 1, 'y': 3}, 'b': {'x': 0}},
+    {'a': {'x': 1}, 'c': {'x': 5}},
+    {'a': {'x': 2, 'z': [1, 2]}, 'c': {'x': 5}},
+    {'a': {'x': 2, 'z': [1, 2]}},
+    {'b': {'x': 0}, 'a': {'x': 2, 'z': [1, 2]}},
+    {'c': {'x': 1}, 'b': {'x': 0}, 'a': {'x': 2, 'z': [1, 2]}},
+    {'b': {'x': 0}, 'a': {'x': 2, 'z': [1, 2]}}
+]
+
+
+def test_deltas_hold_only_changes():
+    encoded = list(encode_deltas(FRAMES, 10))
+
+    assert encoded[0] == {'keyframe': FRAMES[0]}
+    assert encoded[1] == {'delta': {'a': {'y': 3}}}
+    assert encoded[2] == {'delta': {'c': {'x': 5}}, 'removed': ['b'], 'removedKeys': {'a': ['y']}}
+    assert encoded[3] == {'delta': {'a': {'x': 2, 'z': [1, 2]}}}
+    assert encoded[4] == {'delta': {}, 'removed': ['c']}
+
+    # Shapes added before existing ones carry the new draw order.
+    assert encoded[5] == {'delta': {'b': {'x': 0}}, 'order': ['b', 'a']}
+    assert encoded[6] == {'delta': {'c': {'x': 1}}, 'order': ['c', 'b', 'a']}
+    assert encoded[7] == {'delta': {}, 'removed': ['c']}
+
+
+def test_deltas_decode_to_frames():
+    for interval in (1, 2, 10):
+        decoded = list(decode(encode_deltas(FRAMES, interval)))
+
+        assert decoded == FRAMES
+        assert [list(frame) for frame in decoded] == [list(frame) for frame in FRAMES]
+
+
+def test_keyframes_at_interval():
+    encoded = list(encode_deltas(FRAMES, 2))
+
+    assert ['keyframe' in frame for frame in encoded] == [True, False] * 4
+
+
+def test_keyframe_interval_must_be_positive(client):
+    sequence = Sequence(client, [])
+
+    for interval in (0, -1):
+        with pytest.raises(ValueError):
+            sequence.iter_rendered_frames(delta=True, keyframe_interval=interval)
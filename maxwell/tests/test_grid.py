@@ -0,0 +1,56 @@
+import numpy as np
+
+from maxwell.core.coordinates.cartesian.system import CartesianGridConfig, CartesianSystem
+
+
+def record_messages(client):
+    messages = []
+    send_message = client.send_message
+
+    def record(mess, encoder=None):
+        messages.append(mess)
+        send_message(mess, encoder)
+
+    client.send_message = record
+
+    return messages
+
+
+def drawn_count(messages):
+    return sum(len(mess['args']['shapes']) for mess in messages)
+
+
+def test_incremental_grid_sends_only_added_shapes(client):
+    system = CartesianSystem(client, (80., 80.), client.get_shape() / 2)
+    messages = record_messages(client)
+
+    group = system.get_grid(incremental=True)
+    assert drawn_count(messages) == len(group.shapes)
+
+    # Growing the viewport without moving the origin or scale only
+    # draws the lines and labels that entered it.
+    messages.clear()
+    before = set(group.shapes)
+
+    client.shape = np.array((1600, 800))
+    system.get_grid(incremental=True)
+
+    added = set(group.shapes) - before
+
+    assert added
+    assert drawn_count(messages) == len(added)
+
+    # Panning moves everything.
+    messages.clear()
+    system.get_grid(translation=(1, 0), incremental=True)
+
+    assert drawn_count(messages) == len(group.shapes)
+
+
+def test_get_grid_does_not_mutate_config(client):
+    system = CartesianSystem(client, (80., 80.), client.get_shape() / 2)
+    grid_config = CartesianGridConfig()
+
+    system.get_grid(zoom_factor=2, grid_config=grid_config, incremental=True)
+
+    assert (grid_config.step_x, grid_config.step_y) == (1, 1)
@@ -0,0 +1,77 @@
+import numpy as np
+
+from maxwell.core.scene import Scene
+from maxwell.shapes.curve import Curve
+from maxwell.shapes.shape import ShapeConfig
+
+
+def test_in_place_changes_are_seen(system):
+    curve = Curve([(0, 0), (1, 1)])
+    before = curve.get_props()
+
+    curve.properties.points[1][1] = 2
+
+    after = curve.get_props()
+
+    assert np.allclose(before['points'][1], (680, 320))
+    assert np.allclose(after['points'][1], (680, 240))
+
+
+def test_in_place_array_changes_are_seen(system):
+    curve = Curve([(0, 0), (1, 1)])
+    curve.properties.points = np.array([[0., 0.], [1., 1.]])
+    curve.get_props()
+
+    curve.properties.points[1, 1] = 2
+
+    assert np.allclose(curve.get_props()['points'][1], (680, 240))
+
+
+def test_static_shapes_are_not_renormalized(system, monkeypatch):
+    scene = Scene(properties={})
+
+    static = [Curve([(i, 0), (i, 1)]) for i in range(5)]
+    moving = Curve([(0, 0), (1, 1)])
+
+    for shape in (*static, moving):
+        scene.add_shape(shape)
+
+    scene.render_shapes(scene.shapes.values())
+
+    calls = []
+    normalize = system.normalize
+    monkeypatch.setattr(system, 'normalize', lambda obj: calls.append(obj) or normalize(obj))
+
+    for k in range(3):
+        moving.properties.points = [(0, 0), (1, k)]
+        scene.render_shapes(scene.shapes.values())
+
+    # Only the moving curve's points, arrow head and clip are normalized.
+    assert len(calls) == 3 * 3
+
+
+def test_uncached_output_is_recomputed(system):
+    curve = Curve([(0, 0), (1, 1)], shape_config=ShapeConfig(cached=False))
+
+    assert curve.get_props()['points'] is not curve.get_props()['points']
+
+
+def test_cached_output_follows_assignments_and_system_changes(system):
+    curve = Curve([(0, 0), (1, 1)])
+    first = curve.get_props()
+
+    assert curve.get_props()['points'] is first['points']
+
+    curve.properties.points = [(0, 0), (2, 2)]
+    assert np.allclose(curve.get_props()['points'][1], (760, 240))
+
+    system.scale = np.array((40., 40.))
+    assert np.allclose(curve.get_props()['points'][1], (680, 320))
+
+
+def test_cached_output_is_a_copy(system):
+    curve = Curve([(0, 0), (1, 1)])
+
+    curve.get_props()['color'] = '#000'
+
+    assert curve.get_props()['color'] == curve.properties.color
@@ -0,0 +1,44 @@
+import numpy as np
+
+from maxwell.core.sampling import adaptive_sample
+
+
+SCALE = (80., 80.)
+
+
+def test_straight_lines_are_not_refined():
+    x, y = adaptive_sample(lambda x: 2*x + 1, -5, 5, SCALE, initial_num=16)
+
+    assert len(x) == 16
+    assert np.allclose(y, 2*x + 1)
+
+
+def test_curves_are_refined_within_budget():
+    x, y = adaptive_sample(np.sin, -5, 5, SCALE, max_points=200)
+
+    assert 32 < len(x) <= 200
+    assert np.all(np.diff(x) > 0)
+    assert np.allclose(y, np.sin(x))
+
+    # Midpoints lie close to the drawn segments.
+    x_mid = (x[:-1] + x[1:]) / 2
+    error = np.abs(np.sin(x_mid) - (y[:-1] + y[1:]) / 2) * SCALE[1]
+
+    assert error.max() < 1
+
+
+def test_jumps_are_broken():
+    x, y = adaptive_sample(lambda x: np.where(x < 0.3, 0., 1.), -1, 1, SCALE)
+
+    breaks = np.flatnonzero(~np.isfinite(y))
+
+    assert len(breaks) == 1
+    assert x[breaks[0] - 1] < 0.3 <= x[breaks[0] + 1]
+
+
+def test_gaps_are_kept():
+    with np.errstate(invalid='ignore'):
+        x, y = adaptive_sample(np.sqrt, -1, 1, SCALE)
+
+    assert np.isnan(y[x < 0]).all()
+    assert np.isfinite(y[x > 0]).all()
@@ -0,0 +1,39 @@
+import numpy as np
+
+from maxwell.core.animation import AnimationConfig
+from maxwell.core.scene import Scene
+from maxwell.shapes.arc import Arc
+
+
+def test_animate_param_is_interpolated_when_resampled(system):
+    scene = system.animate_param(
+        lambda x, t: x * t, 0, 1,
+        point_num=10,
+        animation_config=AnimationConfig(duration=0.5, fps=10)
+    )
+
+    assert scene.resamples(20)
+    assert scene.get_output_count(20) == 2 * scene.get_frame_count()
+
+    frames = [np.array(scene.frame_at(k, True)['graph']['points']) for k in range(scene.get_frame_count())]
+    resampled = [np.array(scene.frame_at(k, True, 20)['graph']['points']) for k in range(scene.get_output_count(20))]
+
+    # Every other output frame is a source frame, and those between
+    # lie halfway between their neighbours.
+    for k, frame in enumerate(frames):
+        assert np.allclose(resampled[2*k + 1], frame)
+
+    for k in range(1, len(frames)):
+        assert np.allclose(resampled[2*k], (frames[k - 1] + frames[k]) / 2)
+
+
+def test_callback_scenes_are_not_resampled(system):
+    arc = Arc((0, 0))
+
+    scene = Scene(properties={}, fps=10)
+    scene.add_shape(arc)
+    scene.repeat_frame(5, lambda frame, props: None, seekable=True)
+
+    assert scene.is_seekable()
+    assert not scene.resamples(20)
+    assert scene.get_output_count(20) == 5
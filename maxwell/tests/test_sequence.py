@@ -0,0 +1,149 @@
+import json
+import pickle
+import random
+import socket
+import threading
+
+import numpy as np
+import pytest
+
+from maxwell.client.client import Client
+from maxwell.core.animation import AnimationConfig
+from maxwell.core.coordinates.cartesian.system import CartesianSystem
+from maxwell.core.scene import Scene
+from maxwell.core.sequence import Sequence
+from maxwell.shapes.arc import Arc
+from maxwell.shapes.curve import Curve, CurveConfig
+from maxwell.shapes.shape import ShapeConfig
+from maxwell.shapes.vector import Vector
+
+
+def build_sequence(client):
+    animation_config = AnimationConfig(duration=0.4, fps=50)
+
+    x = np.linspace(0, 4, 50)
+
+    curve = Curve(np.column_stack((x, np.sin(x))), shape_config=ShapeConfig(shape_name='curve'))
+    vector = Vector((1, 2), curve_config=CurveConfig(), shape_config=ShapeConfig(shape_name='vector'))
+    arc = Arc((0, 0), shape_config=ShapeConfig(shape_name='arc'))
+
+    sequence = Sequence(client, [])
+
+    for scene in (
+        curve.change_color('#00ff00', animation_config=animation_config),
+        curve.transform(np.column_stack((x, np.cos(x))), animation_config=animation_config),
+        vector.move_end((3, -1), animation_config=animation_config),
+        arc.move_to_point((2, 2), animation_config=animation_config),
+        vector.rotate_about(np.zeros(2), 1., animate=True, animation_config=animation_config)
+    ):
+        sequence.add_scene(scene)
+
+    sequence.wait(0.1)
+
+    return sequence
+
+
+def dump(frame):
+    return json.dumps(frame, default=lambda obj: np.round(np.asarray(obj, dtype=float), 6).tolist(), sort_keys=True)
+
+
+def test_frame_at_matches_iter_frames_in_any_order(system):
+    expected = [dump(frame) for frame in build_sequence(system.client).iter_frames(True)]
+
+    sequence = build_sequence(system.client)
+    assert sequence.is_seekable()
+
+    order = list(range(len(expected)))
+    random.Random(1).shuffle(order)
+
+    for k in order:
+        assert dump(sequence.frame_at(k, True)) == expected[k]
+
+
+def test_scene_seek_restores_earlier_state(system):
+    curve = Curve([(0, 0), (1, 1)])
+    scene = curve.transform([(0, 1), (1, 2)], animation_config=AnimationConfig(duration=0.2, fps=50))
+
+    frames = [dump(scene.frame_at(k)) for k in range(scene.get_frame_count())]
+
+    scene.seek(3)
+    assert dump(scene.frame_at(2)) == frames[2]
+
+    scene.seek(0)
+    assert dump(scene.frame_at(0)) == frames[0]
+
+
+def test_iter_frames_parallel_matches_iter_frames(system):
+    expected = [dump(frame) for frame in build_sequence(system.client).iter_frames(True)]
+
+    sequence = build_sequence(system.client)
+    frames = [dump(frame) for frame in sequence.iter_frames_parallel(True, workers=2)]
+
+    assert frames == expected
+
+
+def test_iter_frames_parallel_warns_on_fallback(system):
+    sequence = build_sequence(system.client)
+
+    scene = Scene(system.client, {})
+    scene.add_shape(Arc((0, 0)))
+    scene.repeat_frame(3, lambda frame, props: None, seekable=True)
+    sequence.add_scene(scene)
+
+    expected = len(list(build_sequence(system.client).iter_frames())) + 3
+
+    with pytest.warns(RuntimeWarning):
+        assert len(list(sequence.iter_frames_parallel(workers=2))) == expected
+
+
+def test_iter_frames_parallel_fetches_unknown_viewport_shape():
+    server = socket.create_server(('127.0.0.1', 0))
+
+    def serve():
+        connection, _ = server.accept()
+
+        with connection, connection.makefile('rb') as reader:
+            reader.readline()
+            reader.readline()
+
+            connection.sendall(b'[640, 480]\n')
+            reader.read()
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+
+    client = Client(port=server.getsockname()[1])
+
+    try:
+        assert client.viewport_shape is None
+
+        system = CartesianSystem(client, (80., 80.), (320., 240.))
+        grid = system.get_grid(compound=True, render=False)
+
+        scene = Scene(client, {})
+        scene.add_shape(grid)
+        scene.repeat_frame(4)
+
+        frames = list(Sequence(client, [scene]).iter_frames_parallel(True, workers=2))
+
+        assert np.array_equal(client.viewport_shape, [640, 480])
+        assert [dump(frame) for frame in frames] == [dump(frame) for frame in Sequence(client, [scene]).iter_frames(True)]
+    finally:
+        client.close()
+        thread.join()
+        server.close()
+
+
+def test_iter_frames_parallel_warns_without_viewport_shape():
+    with socket.create_server(('127.0.0.1', 0)) as server:
+        connected = Client(port=server.getsockname()[1])
+
+        # A detached copy that never received the viewport size.
+        client = pickle.loads(pickle.dumps(connected))
+        connected.close()
+
+    scene = Scene(client, {})
+    scene.repeat_frame(2)
+
+    with pytest.warns(RuntimeWarning, match='viewport'):
+        assert len(list(Sequence(client, [scene]).iter_frames_parallel(workers=2))) == 2
@@ -0,0 +1,25 @@
+import numpy as np
+
+from maxwell.core.coordinates.cartesian.system import CartesianSystem
+
+
+def test_normalize_round_trip(client):
+    system = CartesianSystem(client, (80., 40.), (600., 400.))
+
+    points = np.array([[0., 0.], [1., -2.]])
+
+    assert np.allclose(system.normalize(points), [[600, 400], [680, 480]])
+    assert np.allclose(system.from_normalized(system.normalize(points)), points)
+
+    assert system.normalize(2.) == 120
+    assert system.from_normalized(120.) == 2
+
+
+def test_normalize_follows_scale_changes(client):
+    system = CartesianSystem(client, (80., 80.), (600., 400.))
+
+    system.normalize(1.)
+    system.zoom(2)
+
+    assert system.normalize(1.) == 160
+    assert np.allclose(system.normalize([[1., 1.]]), [[760, 240]])
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from maxwell.core.util import evaluate, evaluate_grid
+
+
+def test_evaluate_vectorized():
+    x = np.linspace(-1, 1, 5)
+
+    assert np.allclose(evaluate(np.sin, x), np.sin(x))
+
+
+def test_evaluate_scalar_only():
+    x = np.linspace(-1, 1, 5)
+
+    assert np.allclose(evaluate(lambda x: x if x > 0 else 0., x), np.maximum(x, 0))
+
+
+def test_evaluate_constant():
+    x = np.linspace(-1, 1, 5)
+
+    assert np.allclose(evaluate(lambda x: 2, x), 2)
+
+
+def test_evaluate_reduction_is_applied_per_element():
+    x = np.linspace(-1, 1, 5)
+
+    # `np.sum` of the whole array is a single value, but of each scalar
+    # it's the scalar itself.
+    assert np.allclose(evaluate(np.sum, x), x)
+
+
+def test_evaluate_vectorized_reduction_raises():
+    with pytest.raises(ValueError):
+        evaluate(np.sum, np.linspace(-1, 1, 5), vectorized=True)
+
+
+def test_evaluate_grid():
+    x = np.linspace(-1, 1, 4)
+    t = np.linspace(0, 1, 3)
+
+    expected = np.sin(x[np.newaxis, :] + t[:, np.newaxis])
+
+    assert np.allclose(evaluate_grid(lambda x, t: np.sin(x + t), x, t), expected)
+    assert np.allclose(evaluate_grid(lambda x, t: float(np.sin(x + t)), x, t), expected)
+
+
+def test_evaluate_grid_broadcasts_partial_results():
+    x = np.linspace(-1, 1, 4)
+    t = np.linspace(0, 1, 3)
+
+    assert np.allclose(evaluate_grid(lambda x, t: np.sin(x), x, t), np.tile(np.sin(x), (3, 1)))
+    assert np.allclose(evaluate_grid(lambda x, t: 2, x, t), 2)
+
+
+def test_evaluate_grid_reduction_is_applied_per_element():
+    x = np.linspace(-1, 1, 4)
+    t = np.linspace(0, 1, 3)
+
+    result = evaluate_grid(lambda x, t: np.sum(x) + t, x, t)
+
+    assert np.allclose(result, x[np.newaxis, :] + t[:, np.newaxis])